@@ -4,17 +4,109 @@ Data cleaning script extracted from explore.ipynb.
 This script can be run directly without Jupyter notebook.
 
 Usage:
-    python EDA/clean_data.py
+    python EDA/clean_data.py [--verbose]
+
+Set FAST_IO=1 to read/write CSVs with Polars (falls back to pandas if
+Polars is not installed).
+
+When pyarrow is installed, parsed raw CSVs are cached as Parquet under
+data/.cache (keyed by file modification time) so later runs skip CSV
+parsing, and cleaned datasets are also written as Parquet.
+
+Set CLEAN_CHUNKSIZE=<rows> to stream each CSV in chunks of that many rows
+instead of loading it whole (caps memory for very large files; skips the
+dtype downcast and Parquet outputs).
 """
 
+import importlib.util
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from utils.data_loader import downcast_dtypes
+
+# opt-in multithreaded CSV I/O; default behaviour stays on pandas
+FAST_IO = os.environ.get('FAST_IO') == '1'
+
+# opt-in streaming mode; 0 means load each file whole
+CLEAN_CHUNKSIZE = int(os.environ.get('CLEAN_CHUNKSIZE', '0'))
+
+# Parquet cache/outputs need pyarrow; without it only CSVs are read and written
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# pyarrow reports unsupported or corrupt data as ArrowInvalid/ArrowTypeError,
+# which subclass ValueError/TypeError
+PARQUET_ERRORS = (ImportError, ValueError, TypeError)
+
+
+def _read_csv(path):
+    """Read a CSV into a pandas DataFrame, using Polars when FAST_IO is set."""
+    if FAST_IO:
+        try:
+            import polars as pl
+            return pl.read_csv(path, infer_schema_length=None).to_pandas()
+        except ImportError:
+            pass
+    return pd.read_csv(path)
+
+
+def _write_csv(df, path):
+    """Write a DataFrame to CSV without the index, using Polars when FAST_IO is set."""
+    if FAST_IO:
+        try:
+            import polars as pl
+            pl.from_pandas(df).write_csv(path)
+            return
+        except ImportError:
+            pass
+    df.to_csv(path, index=False)
+
+
+def _load_raw(csv_file):
+    """
+    Load a raw CSV, reusing a Parquet copy from data/.cache if the CSV has not
+    changed since it was cached. Falls back to plain CSV parsing if pyarrow is
+    not installed or the frame cannot be stored as Parquet.
+    """
+    if not HAS_PYARROW:
+        return _read_csv(csv_file)
+    
+    cache_dir = csv_file.parent / '.cache'
+    mtime = int(csv_file.stat().st_mtime)
+    cache_file = cache_dir / f"{csv_file.stem}_{mtime}.parquet"
+    
+    if cache_file.exists():
+        try:
+            return pd.read_parquet(cache_file, engine='pyarrow')
+        except PARQUET_ERRORS:
+            pass  # unreadable cache, parse the CSV again
+    
+    df = _read_csv(csv_file)
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        df.to_parquet(cache_file, engine='pyarrow', compression='snappy')
+    except PARQUET_ERRORS:
+        cache_file.unlink(missing_ok=True)  # no partial cache left behind
+        return df
+    
+    # drop caches of older versions of this file
+    for stale in cache_dir.glob(f"{csv_file.stem}_*.parquet"):
+        if stale != cache_file:
+            stale.unlink()
+    
+    return df
+
 
-def clean_dataset(df, dataset_name):
+def clean_dataset(df, dataset_name, verbose=False):
     """
     Clean a dataset by removing null values based on thresholds.
     
@@ -22,6 +114,8 @@ def clean_dataset(df, dataset_name):
     1. Drop columns with >40% null values
     2. Drop rows with null values in columns that have 10-40% null values
     3. Drop rows with null values in columns that have <10% null values
+    
+    Set verbose=True to list every affected column with its null percentage.
     """
     original_shape = df.shape
     print(f"\n{'=' * 80}")
@@ -29,36 +123,50 @@ def clean_dataset(df, dataset_name):
     print(f"{'=' * 80}")
     print(f"Original shape: {original_shape[0]:,} rows × {original_shape[1]} columns\n")
     
+    # scan the frame for nulls once; later steps slice this mask instead of
+    # re-running isnull() over the whole DataFrame
+    na_mask = df.isna()
+    null_percentages = na_mask.sum() / len(df) * 100
+
     # drop columns with >40% null values
-    null_percentages = df.isnull().sum() / len(df) * 100
     columns_to_drop_high = null_percentages[null_percentages > 40].index.tolist()
-    
+
     if columns_to_drop_high:
         print(f"Dropping {len(columns_to_drop_high)} columns with >40% null values:")
-        for col in columns_to_drop_high:
-            print(f"  - {col}: {null_percentages[col]:.2f}% null")
+        if verbose:
+            for col in columns_to_drop_high:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
         df = df.drop(columns=columns_to_drop_high)
-    
+        na_mask = na_mask.drop(columns=columns_to_drop_high)
+        null_percentages = null_percentages.drop(columns_to_drop_high)
+
     # drop rows with null values in columns that have 10-40% null values
-    null_percentages = df.isnull().sum() / len(df) * 100
+    # (dropping columns does not change the percentages of the remaining ones)
     columns_medium = null_percentages[(null_percentages >= 10) & (null_percentages <= 40)].index.tolist()
-    
+
     if columns_medium:
         print(f"\nDropping rows with null values in {len(columns_medium)} columns (10-40% nulls):")
-        for col in columns_medium:
-            print(f"  - {col}: {null_percentages[col]:.2f}% null")
-        df = df.dropna(subset=columns_medium)
-    
+        if verbose:
+            for col in columns_medium:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
+        keep_mask = ~na_mask[columns_medium].any(axis=1)
+        df = df.loc[keep_mask]
+        na_mask = na_mask.loc[keep_mask]
+        # percentages are relative to the surviving rows from here on
+        null_percentages = na_mask.sum() / len(df) * 100
+
 
     # drop rows with null values in columns that have <10% null values
-    null_percentages = df.isnull().sum() / len(df) * 100
     columns_low = null_percentages[(null_percentages > 0) & (null_percentages < 10)].index.tolist()
-    
+
     if columns_low:
         print(f"\nDropping rows with null values in {len(columns_low)} columns (<10% nulls):")
-        for col in columns_low:
-            print(f"  - {col}: {null_percentages[col]:.2f}% null")
-        df = df.dropna(subset=columns_low)
+        if verbose:
+            for col in columns_low:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
+        keep_mask = ~na_mask[columns_low].any(axis=1)
+        df = df.loc[keep_mask]
+        na_mask = na_mask.loc[keep_mask]
     else:
         print("\nNo columns with <10% null values found.")
     
@@ -69,12 +177,199 @@ def clean_dataset(df, dataset_name):
     
     print(f"\nFinal shape: {final_shape[0]:,} rows × {final_shape[1]} columns")
     print(f"Removed: {rows_removed:,} rows ({rows_removed/original_shape[0]*100:.2f}%) and {cols_removed} columns")
-    print(f"Remaining null values: {df.isnull().sum().sum()}")
+    # na_mask is kept aligned with df, so no extra scan is needed
+    print(f"Remaining null values: {int(na_mask.to_numpy().sum())}")
     
     return df
 
 
-def main():
+def clean_csv_chunked(csv_file, output_file, dataset_name, chunksize=200_000, verbose=False):
+    """
+    Apply the same rules as clean_dataset, streaming the CSV in chunks so
+    memory stays at O(chunksize) instead of O(file).
+    
+    Pass 1 counts nulls per column, pass 2 counts the nulls left after the
+    10-40% row drop (the <10% rule is decided on those rows, as in
+    clean_dataset), and pass 3 filters each chunk and appends it to
+    output_file. Returns the summary dict used for the cleaning report.
+    """
+    print(f"\n{'=' * 80}")
+    print(f"CLEANING DATASET: {dataset_name} (chunks of {chunksize:,} rows)")
+    print(f"{'=' * 80}")
+    
+    # pass 1: null counts over the whole file
+    null_counts = None
+    total_rows = 0
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize):
+        counts = chunk.isna().sum()
+        null_counts = counts if null_counts is None else null_counts + counts
+        total_rows += len(chunk)
+    
+    if null_counts is None:
+        print("Empty file, nothing to clean.")
+        return None
+    
+    original_cols = len(null_counts)
+    print(f"Original shape: {total_rows:,} rows × {original_cols} columns\n")
+    null_percentages = null_counts / total_rows * 100
+    
+    # drop columns with >40% null values
+    columns_to_drop_high = null_percentages[null_percentages > 40].index.tolist()
+    if columns_to_drop_high:
+        print(f"Dropping {len(columns_to_drop_high)} columns with >40% null values:")
+        if verbose:
+            for col in columns_to_drop_high:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
+        null_percentages = null_percentages.drop(columns_to_drop_high)
+    
+    kept_columns = null_percentages.index.tolist()
+    
+    # drop rows with null values in columns that have 10-40% null values
+    columns_medium = null_percentages[(null_percentages >= 10) & (null_percentages <= 40)].index.tolist()
+    if columns_medium:
+        print(f"\nDropping rows with null values in {len(columns_medium)} columns (10-40% nulls):")
+        if verbose:
+            for col in columns_medium:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
+        
+        # pass 2: percentages relative to the rows that survive the drop
+        null_counts = None
+        surviving_rows = 0
+        for chunk in pd.read_csv(csv_file, chunksize=chunksize, usecols=kept_columns):
+            chunk = chunk.dropna(subset=columns_medium)
+            counts = chunk.isna().sum()
+            null_counts = counts if null_counts is None else null_counts + counts
+            surviving_rows += len(chunk)
+        null_percentages = null_counts[kept_columns] / surviving_rows * 100
+    
+    # drop rows with null values in columns that have <10% null values
+    columns_low = null_percentages[(null_percentages > 0) & (null_percentages < 10)].index.tolist()
+    if columns_low:
+        print(f"\nDropping rows with null values in {len(columns_low)} columns (<10% nulls):")
+        if verbose:
+            for col in columns_low:
+                print(f"  - {col}: {null_percentages[col]:.2f}% null")
+    else:
+        print("\nNo columns with <10% null values found.")
+    
+    # pass 3: filter and append each chunk to the output file
+    subset = columns_medium + columns_low
+    final_rows = 0
+    remaining_nulls = 0
+    memory = 0
+    for i, chunk in enumerate(pd.read_csv(csv_file, chunksize=chunksize, usecols=kept_columns)):
+        chunk = chunk[kept_columns]
+        if subset:
+            chunk = chunk.dropna(subset=subset)
+        chunk.to_csv(output_file, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        final_rows += len(chunk)
+        remaining_nulls += chunk.isnull().sum().sum()
+        memory += estimate_memory(chunk)
+    
+    rows_removed = total_rows - final_rows
+    cols_removed = original_cols - len(kept_columns)
+    
+    print(f"\nFinal shape: {final_rows:,} rows × {len(kept_columns)} columns")
+    print(f"Removed: {rows_removed:,} rows ({rows_removed/total_rows*100:.2f}%) and {cols_removed} columns")
+    print(f"Remaining null values: {remaining_nulls}")
+    
+    return {
+        'shape': (final_rows, len(kept_columns)),
+        'columns': kept_columns,
+        'memory_before': memory,
+        'memory': memory,
+        'missing': remaining_nulls
+    }
+
+
+def estimate_memory(df):
+    """
+    Cheap estimate of a DataFrame's memory in bytes.
+    
+    memory_usage(deep=True) measures every Python string object, which is
+    very slow on large object columns. Instead use the shallow size and add
+    the total string length of string columns. Object columns holding
+    anything else (e.g. bools with missing values) are measured deeply.
+    """
+    memory = df.memory_usage(deep=False).sum()
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            memory += df[col].str.len().sum()
+        else:
+            memory += (df[col].memory_usage(deep=True, index=False)
+                       - df[col].memory_usage(deep=False, index=False))
+    return int(memory)
+
+
+def _process_one(csv_file, cleaned_dir, verbose=False):
+    """
+    Load, clean and save a single dataset (runs in a worker process).
+    
+    Returns (dataset_name, summary) where summary only holds the lightweight
+    stats needed for the report, so the DataFrame never crosses the process
+    boundary. summary is None if the dataset could not be processed.
+    """
+    dataset_name = csv_file.stem
+    
+    try:
+        if CLEAN_CHUNKSIZE > 0:
+            output_file = cleaned_dir / f"{dataset_name}_cleaned.csv"
+            summary = clean_csv_chunked(csv_file, output_file, dataset_name, CLEAN_CHUNKSIZE, verbose)
+            if summary is not None:
+                print(f"\nSaved cleaned dataset to: {output_file.name}")
+            return dataset_name, summary
+        
+        # load dataset
+        print(f"\n{'=' * 80}")
+        print(f"Loading: {dataset_name}")
+        print(f"{'=' * 80}")
+        df = _load_raw(csv_file)
+        print(f"Loaded {len(df):,} rows")
+        
+        # clean dataset
+        cleaned_df = clean_dataset(df, dataset_name, verbose)
+        
+        # narrow dtypes before writing (smaller frame, less formatting work);
+        # the full-width frame is kept for the Parquet copy, since float32
+        # values written there would not read back as the CSV's numbers
+        memory_before = estimate_memory(cleaned_df)
+        exact_df = cleaned_df
+        cleaned_df = downcast_dtypes(cleaned_df)
+        
+        # save cleaned dataset
+        output_file = cleaned_dir / f"{dataset_name}_cleaned.csv"
+        _write_csv(cleaned_df, output_file)
+        print(f"\nSaved cleaned dataset to: {output_file.name}")
+        
+        # typed columnar copy for downstream loaders (needs pyarrow); the CSV
+        # above is the source of truth, so a failed copy is only reported
+        if HAS_PYARROW:
+            parquet_file = cleaned_dir / f"{dataset_name}_cleaned.parquet"
+            try:
+                exact_df.to_parquet(parquet_file, engine='pyarrow', compression='snappy')
+                print(f"Saved cleaned dataset to: {parquet_file.name}")
+            except PARQUET_ERRORS as e:
+                # don't leave a partial or outdated copy next to the new CSV
+                parquet_file.unlink(missing_ok=True)
+                print(f"WARNING: Skipped Parquet copy of {dataset_name}: {e}")
+        
+        summary = {
+            'shape': cleaned_df.shape,
+            'columns': list(cleaned_df.columns),
+            'memory_before': memory_before,
+            'memory': estimate_memory(cleaned_df),
+            'missing': cleaned_df.isnull().sum().sum()
+        }
+        return dataset_name, summary
+        
+    except Exception as e:
+        print(f"\nERROR: Error processing {dataset_name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return dataset_name, None
+
+
+def main(verbose=False):
     """Main function to clean all datasets."""
     # set up paths
     script_dir = Path(__file__).parent
@@ -107,57 +402,42 @@ def main():
     for file in csv_files:
         print(f"  - {file.name}")
     
-    # load and clean each dataset
-    cleaned_dataframes = {}
+    # load and clean each dataset - the files are independent, so each one
+    # is processed in its own worker process
+    cleaned_summaries = {}
+    max_workers = min(len(csv_files), os.cpu_count() or 1)
     
-    for csv_file in csv_files:
-        dataset_name = csv_file.stem
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_process_one, csv_file, cleaned_dir, verbose) for csv_file in csv_files]
         
-        try:
-            # load dataset
-            print(f"\n{'=' * 80}")
-            print(f"Loading: {dataset_name}")
-            print(f"{'=' * 80}")
-            df = pd.read_csv(csv_file)
-            print(f"Loaded {len(df):,} rows")
-            
-            # clean dataset
-            cleaned_df = clean_dataset(df, dataset_name)
-            cleaned_dataframes[dataset_name] = cleaned_df
-            
-            # save cleaned dataset
-            output_file = cleaned_dir / f"{dataset_name}_cleaned.csv"
-            cleaned_df.to_csv(output_file, index=False)
-            print(f"\nSaved cleaned dataset to: {output_file.name}")
-            
-        except Exception as e:
-            print(f"\nERROR: Error processing {dataset_name}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+        for future in futures:
+            dataset_name, summary = future.result()
+            if summary is not None:
+                cleaned_summaries[dataset_name] = summary
     
     # save summary
-    if cleaned_dataframes:
+    if cleaned_summaries:
         summary_file = cleaned_dir / 'cleaning_summary.txt'
         with open(summary_file, 'w') as f:
             f.write("=" * 80 + "\n")
             f.write("DATA CLEANING SUMMARY\n")
             f.write("=" * 80 + "\n\n")
             
-            for name, df in cleaned_dataframes.items():
+            for name, summary in cleaned_summaries.items():
                 f.write(f"Dataset: {name}\n")
                 f.write("-" * 80 + "\n")
-                f.write(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns\n")
-                f.write(f"Columns: {', '.join(df.columns)}\n")
-                f.write(f"Memory: {df.memory_usage(deep=True).sum() / (1024**2):.2f} MB\n")
-                f.write(f"Missing values: {df.isnull().sum().sum()}\n\n")
+                f.write(f"Shape: {summary['shape'][0]:,} rows × {summary['shape'][1]} columns\n")
+                f.write(f"Columns: {', '.join(summary['columns'])}\n")
+                f.write(f"Memory (before downcast): {summary['memory_before'] / (1024**2):.2f} MB\n")
+                f.write(f"Memory: {summary['memory'] / (1024**2):.2f} MB\n")
+                f.write(f"Missing values: {summary['missing']}\n\n")
         
         print("\n" + "=" * 80)
         print("CLEANING COMPLETE!")
         print("=" * 80)
-        print(f"\nCleaned {len(cleaned_dataframes)} dataset(s):")
-        for name, df in cleaned_dataframes.items():
-            print(f"  {name}: {df.shape[0]:,} rows × {df.shape[1]} columns")
+        print(f"\nCleaned {len(cleaned_summaries)} dataset(s):")
+        for name, summary in cleaned_summaries.items():
+            print(f"  {name}: {summary['shape'][0]:,} rows × {summary['shape'][1]} columns")
         print(f"\nSaved to: {cleaned_dir.absolute()}")
         return True
     else:
@@ -166,6 +446,7 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    import sys
+    success = main(verbose='--verbose' in sys.argv[1:])
     exit(0 if success else 1)
 
@@ -5,10 +5,18 @@ Analyzes performance, characteristics, and behaviors of different tree types.
 
 import sys
 from pathlib import Path
-import time
+import timeit
 import json
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -23,10 +31,12 @@ def get_tree_metadata(tree, tree_type):
         'height': tree.get_height() if hasattr(tree, 'get_height') else 'N/A'
     }
     
-    # Count nodes (if possible)
+    # Count nodes (if possible) - O(1) when the tree tracks its own count
     try:
-        if hasattr(tree, 'root'):
-            node_count = count_nodes(tree.root)
+        if hasattr(tree, 'get_node_count'):
+            metadata['node_count'] = tree.get_node_count()
+        elif hasattr(tree, 'root'):
+            node_count = count_nodes(tree.root, sentinel=getattr(tree, 'NIL', None))
             metadata['node_count'] = node_count
     except:
         metadata['node_count'] = 'N/A'
@@ -34,103 +44,151 @@ def get_tree_metadata(tree, tree_type):
     return metadata
 
 
-def count_nodes(node):
-    """Recursively count nodes in a tree."""
-    if node is None:
+def count_nodes(node, sentinel=None):
+    """
+    Count nodes in a tree iteratively (safe for very deep trees).
+    
+    The node shape is checked once on the root and the count is delegated
+    to a loop specialised for it, so no attribute probing happens per node.
+    sentinel is the tree's shared leaf node (e.g. the Red-Black tree's NIL);
+    it is neither counted nor pushed onto the stack.
+    """
+    if node is None or node is sentinel:
         return 0
     
-    count = 1
+    if hasattr(node, 'middle'):
+        return _count_ternary(node)
     if hasattr(node, 'left') and hasattr(node, 'right'):
-        count += count_nodes(node.left)
-        count += count_nodes(node.right)
-    elif hasattr(node, 'children'):
-        for child in node.children.values():
-            count += count_nodes(child)
-    
+        return _count_binary(node, sentinel)
+    if hasattr(node, 'children'):
+        return _count_n_ary(node)
+    return 1
+
+
+def _count_binary(root, sentinel=None):
+    """Count nodes of a binary tree (BST, AVL, Red-Black)."""
+    count = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        count += 1
+        left = current.left
+        if left is not None and left is not sentinel:
+            stack.append(left)
+        right = current.right
+        if right is not None and right is not sentinel:
+            stack.append(right)
+    return count
+
+
+def _count_ternary(root):
+    """Count nodes of a ternary search tree."""
+    count = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        count += 1
+        if current.left is not None:
+            stack.append(current.left)
+        if current.middle is not None:
+            stack.append(current.middle)
+        if current.right is not None:
+            stack.append(current.right)
     return count
 
 
+def _count_n_ary(root):
+    """Count nodes of a tree whose nodes keep a children dict (tries)."""
+    count = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        count += 1
+        stack.extend(current.children.values())
+    return count
+
+
+# timeit settings: each operation runs TIMEIT_NUMBER times per repeat and
+# the fastest repeat is kept (min-of-repeats filters out scheduler noise)
+TIMEIT_NUMBER = 100
+TIMEIT_REPEAT = 5
+
+
+def time_operation(func, number=TIMEIT_NUMBER, repeat=TIMEIT_REPEAT):
+    """Return the best per-call time of func() in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+# Per-operation benchmark records, stored column-wise in structured arrays
+SEARCH_DTYPE = np.dtype([('rating', 'f8'), ('found', '?'), ('time_ms', 'f8'), ('num_results', 'i4')])
+TOPK_DTYPE = np.dtype([('k', 'i4'), ('time_ms', 'f8'), ('results_returned', 'i4')])
+RANGE_DTYPE = np.dtype([('range', 'U32'), ('time_ms', 'f8'), ('results_returned', 'i4')])
+
+
+def _records_to_dicts(records):
+    """Convert a structured array to a JSON-friendly list of dicts."""
+    names = records.dtype.names
+    return [dict(zip(names, row)) for row in records.tolist()]
+
+
 def benchmark_search_operations(tree, tree_type, dataset_name, test_ratings):
     """Benchmark search operations on a tree."""
-    results = []
+    records = np.empty(len(test_ratings), dtype=SEARCH_DTYPE)
     
-    for rating in test_ratings:
-        start = time.perf_counter()
+    for i, rating in enumerate(test_ratings):
         found = tree.search(rating)
-        elapsed = time.perf_counter() - start
-        
-        results.append({
-            'rating': rating,
-            'found': found is not None,
-            'time_ms': elapsed * 1000,
-            'num_results': len(found) if found else 0
-        })
+        elapsed_ms = time_operation(lambda: tree.search(rating))
+        records[i] = (rating, found is not None, elapsed_ms, len(found) if found else 0)
     
-    avg_time = sum(r['time_ms'] for r in results) / len(results)
+    times = records['time_ms']
     
     return {
         'tree_type': tree_type,
         'dataset': dataset_name,
         'operation': 'search',
         'num_tests': len(test_ratings),
-        'avg_time_ms': avg_time,
-        'min_time_ms': min(r['time_ms'] for r in results),
-        'max_time_ms': max(r['time_ms'] for r in results),
-        'details': results
+        'avg_time_ms': float(times.mean()),
+        'min_time_ms': float(times.min()),
+        'max_time_ms': float(times.max()),
+        'details': _records_to_dicts(records)
     }
 
 
 def benchmark_topk_operations(tree, tree_type, dataset_name, k_values=[10, 50, 100]):
     """Benchmark top-K operations on a tree."""
-    results = []
+    records = np.empty(len(k_values), dtype=TOPK_DTYPE)
     
-    for k in k_values:
-        start = time.perf_counter()
+    for i, k in enumerate(k_values):
         top_k = tree.get_top_k(k)
-        elapsed = time.perf_counter() - start
-        
-        results.append({
-            'k': k,
-            'time_ms': elapsed * 1000,
-            'results_returned': len(top_k)
-        })
-    
-    avg_time = sum(r['time_ms'] for r in results) / len(results)
+        elapsed_ms = time_operation(lambda: tree.get_top_k(k))
+        records[i] = (k, elapsed_ms, len(top_k))
     
     return {
         'tree_type': tree_type,
         'dataset': dataset_name,
         'operation': 'top_k',
         'num_tests': len(k_values),
-        'avg_time_ms': avg_time,
-        'details': results
+        'avg_time_ms': float(records['time_ms'].mean()),
+        'details': _records_to_dicts(records)
     }
 
 
 def benchmark_range_operations(tree, tree_type, dataset_name, ranges):
     """Benchmark range query operations on a tree."""
-    results = []
+    records = np.empty(len(ranges), dtype=RANGE_DTYPE)
     
-    for min_rating, max_rating in ranges:
-        start = time.perf_counter()
+    for i, (min_rating, max_rating) in enumerate(ranges):
         range_results = tree.get_range(min_rating, max_rating)
-        elapsed = time.perf_counter() - start
-        
-        results.append({
-            'range': f"{min_rating}-{max_rating}",
-            'time_ms': elapsed * 1000,
-            'results_returned': len(range_results)
-        })
-    
-    avg_time = sum(r['time_ms'] for r in results) / len(results)
+        elapsed_ms = time_operation(lambda: tree.get_range(min_rating, max_rating))
+        records[i] = (f"{min_rating}-{max_rating}", elapsed_ms, len(range_results))
     
     return {
         'tree_type': tree_type,
         'dataset': dataset_name,
         'operation': 'range_query',
         'num_tests': len(ranges),
-        'avg_time_ms': avg_time,
-        'details': results
+        'avg_time_ms': float(records['time_ms'].mean()),
+        'details': _records_to_dicts(records)
     }
 
 
@@ -162,12 +220,14 @@ def analyze_dataset_trees(dataset_name, df):
         }
     }
     
-    # Get sample ratings for testing
-    sample_ratings = df['overall_rating'].sample(min(10, len(df))).tolist()
+    # Get sample ratings for testing (fixed seed so runs are comparable)
+    ratings_arr = df['overall_rating'].to_numpy()
+    rng = np.random.default_rng(0)
+    sample_ratings = rng.choice(ratings_arr, size=min(10, ratings_arr.size), replace=False).tolist()
     
     # Define test ranges based on dataset statistics
-    min_rating = df['overall_rating'].min()
-    max_rating = df['overall_rating'].max()
+    min_rating = float(ratings_arr.min())
+    max_rating = float(ratings_arr.max())
     mid_rating = (min_rating + max_rating) / 2
     
     test_ranges = [
@@ -232,56 +292,44 @@ def generate_summary_report(all_results):
             'tree_heights': {name: meta['height'] for name, meta in result['tree_metadata'].items()}
         }
     
+    # Long-form table of every benchmark: (tree_type, operation, dataset, avg_ms)
+    rows = [
+        (b['tree_type'], operation, result['dataset'], b['avg_time_ms'])
+        for result in all_results
+        for operation, benchmarks in result['performance_benchmarks'].items()
+        for b in benchmarks
+    ]
+    perf_long = pd.DataFrame(rows, columns=['tree_type', 'operation', 'dataset', 'avg_ms'])
+    
     # Compare tree performance across datasets
     all_tree_types = set()
     for result in all_results:
         all_tree_types.update(result['trees_analyzed'])
     
+    times_keys = {'search': 'avg_search_time', 'top_k': 'avg_topk_time', 'range_query': 'avg_range_time'}
     for tree_type in all_tree_types:
+        tree_perf = perf_long[perf_long['tree_type'] == tree_type]
         summary['tree_comparisons'][tree_type] = {
-            'datasets': [],
-            'avg_search_time': [],
-            'avg_topk_time': [],
-            'avg_range_time': []
+            'datasets': [r['dataset'] for r in all_results if tree_type in r['trees_analyzed']]
         }
-        
-        for result in all_results:
-            if tree_type in result['trees_analyzed']:
-                dataset = result['dataset']
-                summary['tree_comparisons'][tree_type]['datasets'].append(dataset)
-                
-                # Get average times
-                search_times = [b for b in result['performance_benchmarks']['search'] if b['tree_type'] == tree_type]
-                topk_times = [b for b in result['performance_benchmarks']['top_k'] if b['tree_type'] == tree_type]
-                range_times = [b for b in result['performance_benchmarks']['range_query'] if b['tree_type'] == tree_type]
-                
-                if search_times:
-                    summary['tree_comparisons'][tree_type]['avg_search_time'].append(search_times[0]['avg_time_ms'])
-                if topk_times:
-                    summary['tree_comparisons'][tree_type]['avg_topk_time'].append(topk_times[0]['avg_time_ms'])
-                if range_times:
-                    summary['tree_comparisons'][tree_type]['avg_range_time'].append(range_times[0]['avg_time_ms'])
+        for operation, times_key in times_keys.items():
+            summary['tree_comparisons'][tree_type][times_key] = \
+                tree_perf.loc[tree_perf['operation'] == operation, 'avg_ms'].tolist()
     
     # Generate key findings
     print("\nKEY FINDINGS:")
     
-    # Find fastest tree for each operation
-    for op_type in ['search', 'top_k', 'range_query']:
-        op_name = op_type.replace('_', ' ').title()
-        fastest_tree = None
-        fastest_time = float('inf')
+    # Find fastest tree for each operation (mean over datasets, then idxmin per column)
+    if not perf_long.empty:
+        perf = perf_long.pivot_table(index='tree_type', columns='operation', values='avg_ms', aggfunc='mean')
+        fastest_trees = perf.idxmin(axis=0)
         
-        for tree_type in all_tree_types:
-            if tree_type in summary['tree_comparisons']:
-                times_key = f"avg_{op_type}_time" if op_type != 'top_k' else 'avg_topk_time'
-                times = summary['tree_comparisons'][tree_type].get(times_key, [])
-                if times:
-                    avg = sum(times) / len(times)
-                    if avg < fastest_time:
-                        fastest_time = avg
-                        fastest_tree = tree_type
-        
-        if fastest_tree:
+        for op_type in ['search', 'top_k', 'range_query']:
+            if op_type not in perf.columns:
+                continue
+            op_name = op_type.replace('_', ' ').title()
+            fastest_tree = fastest_trees[op_type]
+            fastest_time = perf.loc[fastest_tree, op_type]
             finding = f"Fastest for {op_name}: {fastest_tree} ({fastest_time:.6f} ms avg)"
             summary['key_findings'].append(finding)
             print(f"  - {finding}")
@@ -296,6 +344,17 @@ def generate_summary_report(all_results):
     return summary
 
 
+def dump_json(obj, path):
+    """Write obj to path as indented JSON (uses orjson when installed)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
 def save_results(all_results, summary, output_dir):
     """Save analysis results to JSON files."""
     output_path = Path(output_dir)
@@ -304,14 +363,12 @@ def save_results(all_results, summary, output_dir):
     # Save detailed results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     detailed_file = output_path / f"tree_analysis_detailed_{timestamp}.json"
-    with open(detailed_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    dump_json(all_results, detailed_file)
     print(f"\nDetailed results saved to: {detailed_file}")
     
     # Save summary
     summary_file = output_path / f"tree_analysis_summary_{timestamp}.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, summary_file)
     print(f"Summary saved to: {summary_file}")
     
     # Save human-readable report
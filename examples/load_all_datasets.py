@@ -4,8 +4,10 @@ Run this to see all datasets loaded and compared.
 """
 
 import sys
+import os
 from pathlib import Path
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -17,6 +19,46 @@ from loaders.load_seat_trees import load_seat_data_into_trees
 from utils.tree_persistence import save_trees
 
 
+def _load_and_save(dataset_name, loader_func, dataset_key):
+    """
+    Build and save the trees for one dataset (runs in a worker process).
+    
+    The trees are persisted from inside the worker, and only a small summary
+    (record count, tree heights, load time) is sent back, so the trees and
+    DataFrame never have to be pickled across the process boundary.
+    Returns None if the dataset could not be loaded.
+    """
+    print(f"\n{'='*80}")
+    print(f"Processing {dataset_name} Dataset...")
+    print('='*80)
+    
+    try:
+        start_time = time.time()
+        trees, df = loader_func()
+        elapsed = time.time() - start_time
+        
+        if trees is None:
+            return None
+        
+        print(f"\n{dataset_name} loaded in {elapsed:.2f}s")
+        
+        # Save trees to disk
+        try:
+            save_trees(trees, dataset_key)
+        except Exception as save_error:
+            print(f"\nWARNING: Could not save {dataset_name} trees to disk: {save_error}")
+        
+        return {
+            'records': len(df),
+            'heights': {name: tree.get_height() for name, tree in trees.items()
+                        if name in ('BST', 'AVL', 'Red-Black')},
+            'time': elapsed
+        }
+    except Exception as e:
+        print(f"\nERROR: Error loading {dataset_name}: {e}")
+        return None
+
+
 def main():
     """Load all datasets into tree structures."""
     print("\n" + "=" * 80)
@@ -32,41 +74,23 @@ def main():
         ('Seat', load_seat_data_into_trees, 'seat')
     ]
     
-    for dataset_name, loader_func, dataset_key in datasets:
-        print(f"\n{'='*80}")
-        print(f"Processing {dataset_name} Dataset...")
-        print('='*80)
+    # The datasets are independent, so build them concurrently; processes
+    # (not threads) because tree construction is CPU-bound Python code
+    max_workers = min(len(datasets), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            dataset_name: executor.submit(_load_and_save, dataset_name, loader_func, dataset_key)
+            for dataset_name, loader_func, dataset_key in datasets
+        }
         
-        try:
-            start_time = time.time()
-            trees, df = loader_func()
-            elapsed = time.time() - start_time
-            
-            if trees is not None:
-                all_results[dataset_name] = {
-                    'trees': trees,
-                    'df': df,
-                    'time': elapsed
-                }
-                print(f"\n{dataset_name} loaded in {elapsed:.2f}s")
-                
-                # Save trees to disk
-                try:
-                    trees_to_save = {}
-                    for name, tree in trees.items():
-                        # Skip BST if height is too large for pickle
-                        if name == 'BST' and hasattr(tree, 'get_height') and tree.get_height() > 1000:
-                            print(f"\nWARNING: Skipping {name} save (height {tree.get_height()} too large for pickle)")
-                        else:
-                            trees_to_save[name] = tree
-                    
-                    if trees_to_save:
-                        save_trees(trees_to_save, dataset_key)
-                except Exception as save_error:
-                    print(f"\nWARNING: Could not save {dataset_name} trees to disk: {save_error}")
-                    print("   Trees are still available in memory for current session.")
-        except Exception as e:
-            print(f"\nERROR: Error loading {dataset_name}: {e}")
+        for dataset_name, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"\nERROR: Error loading {dataset_name}: {e}")
+                continue
+            if result is not None:
+                all_results[dataset_name] = result
     
     # Summary
     print("\n" + "=" * 80)
@@ -80,15 +104,14 @@ def main():
         print("-" * 80)
         
         for dataset_name, result in all_results.items():
-            trees = result['trees']
-            df = result['df']
+            heights = result['heights']
             elapsed = result['time']
             
-            bst_height = trees['BST'].get_height()
-            avl_height = trees['AVL'].get_height()
-            rb_height = trees['Red-Black'].get_height()
+            bst_height = heights['BST']
+            avl_height = heights['AVL']
+            rb_height = heights['Red-Black']
             
-            print(f"{dataset_name:<15} {len(df):<10,} {bst_height:<12} {avl_height:<12} {rb_height:<12} {elapsed:<10.2f}s")
+            print(f"{dataset_name:<15} {result['records']:<10,} {bst_height:<12} {avl_height:<12} {rb_height:<12} {elapsed:<10.2f}s")
         
         print("\n" + "=" * 80)
         print("SUCCESS: ALL DATASETS SUCCESSFULLY LOADED!")
@@ -8,6 +8,8 @@ with custom data structures (heap, priority queue, hash table, etc.).
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -46,6 +48,8 @@ def example_2_load_specific_dataset():
     print(f"  Columns: {list(airline_df.columns)}")
     print(f"\nFirst 3 rows:")
     print(airline_df.head(3))
+    
+    return airline_df
 
 
 def example_3_get_dataset_info():
@@ -66,14 +70,15 @@ def example_3_get_dataset_info():
     print(f"  Data types: {info['dtypes']}")
 
 
-def example_4_prepare_for_data_structures():
+def example_4_prepare_for_data_structures(airline_df=None):
     """Example 4: Prepare data for use with custom data structures."""
     print("\n" + "=" * 80)
     print("EXAMPLE 4: Prepare Data for Data Structures")
     print("=" * 80)
     
-    # Load airline dataset
-    airline_df = load_cleaned_data('airline')
+    # Load airline dataset (unless an already loaded one was passed in)
+    if airline_df is None:
+        airline_df = load_cleaned_data('airline')
     
     # Example: Extract data for a heap/priority queue
     # Assuming you want to rank airlines by some score
@@ -85,10 +90,19 @@ def example_4_prepare_for_data_structures():
         rating_col = rating_cols[0]
         airline_col = [col for col in airline_df.columns if 'airline' in col.lower()][0]
         
-        # Convert to list of tuples (score, airline_name) for heap
-        heap_data = list(zip(airline_df[rating_col], airline_df[airline_col]))
-        print(f"Created {len(heap_data):,} (score, airline) tuples for heap")
-        print(f"Sample entries: {heap_data[:5]}")
+        # Keep scores and names as parallel arrays instead of N (score, airline)
+        # tuples; float32 halves the memory of the score column
+        scores = airline_df[rating_col].to_numpy(dtype=np.float32)
+        names = airline_df[airline_col].to_numpy()
+        print(f"Created parallel arrays of {len(scores):,} scores and airline names")
+        
+        # Top-K straight from the arrays: argpartition is O(N), then sort only K
+        k = min(5, len(scores))
+        if k:
+            idx = np.argpartition(-scores, k - 1)[:k]
+            idx = idx[np.argsort(-scores[idx])]
+            top_k = list(zip(scores[idx].tolist(), names[idx].tolist()))
+            print(f"Top {k} (score, airline) entries: {top_k}")
     
     # Example: Create hash table mapping
     print("\n--- Preparing data for Hash Table ---")
@@ -97,16 +111,17 @@ def example_4_prepare_for_data_structures():
     if rating_cols:
         airline_col = [col for col in airline_df.columns if 'airline' in col.lower()][0]
         
-        # Group by airline
-        airline_hash = {}
-        for _, row in airline_df.iterrows():
-            airline_name = row[airline_col]
-            if airline_name not in airline_hash:
-                airline_hash[airline_name] = []
-            airline_hash[airline_name].append(row.to_dict())
+        # Map each airline to the row positions of its reviews (an int array
+        # per airline instead of a list of dicts); slice rows on demand with
+        # airline_df.iloc[airline_hash[name]]
+        airline_hash = airline_df.groupby(airline_col, sort=False).indices
         
         print(f"Created hash table with {len(airline_hash)} unique airlines")
         print(f"Sample airlines: {list(airline_hash.keys())[:5]}")
+        if airline_hash:
+            sample_airline = next(iter(airline_hash))
+            sample_rows = airline_df.iloc[airline_hash[sample_airline]]
+            print(f"Records for {sample_airline}: {len(sample_rows):,}")
     
     # Example: Prepare data records as objects
     print("\n--- Converting to structured records ---")
@@ -118,14 +133,17 @@ def example_4_prepare_for_data_structures():
     print(f"Sample record:\n{records[0]}")
 
 
-def example_5_filter_and_prepare():
+def example_5_filter_and_prepare(airline_df=None):
     """Example 5: Filter data and prepare for Top-K algorithms."""
     print("\n" + "=" * 80)
     print("EXAMPLE 5: Filter and Prepare for Top-K Algorithms")
     print("=" * 80)
     
-    # Load airline dataset
-    airline_df = load_cleaned_data('airline')
+    # Load only the columns this example uses, with narrow dtypes (unless a
+    # loaded frame was passed in)
+    if airline_df is None:
+        airline_df = load_cleaned_data('airline', columns=['airline_name', 'overall_rating'],
+                                       downcast=True)
     
     # Find relevant columns
     airline_col = [col for col in airline_df.columns if 'airline' in col.lower()]
@@ -150,9 +168,10 @@ def example_5_filter_and_prepare():
         top_10 = filtered.nlargest(10, 'avg_rating')
         print(top_10.to_string(index=False))
         
-        # Prepare data for Top-K algorithm
-        topk_data = [(row['avg_rating'], row['airline'], row['review_count']) 
-                     for _, row in filtered.iterrows()]
+        # Prepare data for Top-K algorithm (plain tuples straight from the columns)
+        topk_data = list(zip(filtered['avg_rating'].tolist(),
+                             filtered['airline'].tolist(),
+                             filtered['review_count'].tolist()))
         
         print(f"\nPrepared {len(topk_data)} (rating, airline, count) tuples for Top-K algorithm")
         print(f"Sample entries: {topk_data[:3]}")
@@ -170,10 +189,12 @@ if __name__ == "__main__":
     try:
         # Run all examples
         example_1_load_all_datasets()
-        example_2_load_specific_dataset()
+        airline_df = example_2_load_specific_dataset()
         example_3_get_dataset_info()
-        example_4_prepare_for_data_structures()
-        topk_data = example_5_filter_and_prepare()
+        
+        # Reuse the airline frame from example 2 instead of reloading it
+        example_4_prepare_for_data_structures(airline_df)
+        topk_data = example_5_filter_and_prepare(airline_df)
         
         print("\n" + "=" * 80)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY!")
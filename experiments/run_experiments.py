@@ -7,10 +7,16 @@ and datasets, measuring time and space complexity.
 
 import sys
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -23,15 +29,38 @@ from utils.filter_benchmarks import (
 )
 
 
+# Column order of the flattened benchmark results
+RESULT_FIELDS = (
+    'test_type', 'tree_type', 'dataset', 'dataset_size', 'operation', 'filter_params',
+    'avg_time_ms', 'min_time_ms', 'max_time_ms', 'std_dev_ms',
+    'memory_kb', 'memory_mb', 'peak_memory_kb', 'result_size_kb',
+    'results_count', 'selectivity', 'selectivity_percent'
+)
+
+# Low-cardinality label columns stored as categoricals
+CATEGORICAL_FIELDS = ('test_type', 'tree_type', 'dataset', 'operation', 'filter_params')
+
+# Columns and cell formats of the per-filter tables in the report; to_string
+# joins cells with a single space, so the separators live in the formats
+REPORT_TABLE_COLUMNS = ['tree_type', 'avg_time_ms', 'memory_kb', 'results_count', 'selectivity_percent']
+REPORT_TABLE_FORMATTERS = {
+    'tree_type': '{:12}'.format,
+    'avg_time_ms': '| {:12.3f}'.format,
+    'memory_kb': '| {:12.2f}'.format,
+    'results_count': '| {:10,}'.format,
+    'selectivity_percent': '| {:11.2f}%'.format
+}
+
+
 def save_results_to_csv(results: dict, output_dir: Path):
     """
-    Save benchmark results to CSV files.
+    Save benchmark results to CSV files (plus a Parquet mirror when pyarrow
+    is installed).
     
     Args:
         results: Dictionary of benchmark results
-        output_dir: Directory to save results
+        output_dir: Directory to save results (must already exist)
     """
-    output_dir.mkdir(exist_ok=True, parents=True)
     
     all_rows = []
     
@@ -65,29 +94,66 @@ def save_results_to_csv(results: dict, output_dir: Path):
             all_rows.append(row)
     
     # Create DataFrame and save
-    df = pd.DataFrame(all_rows)
+    df = pd.DataFrame.from_records(all_rows, columns=RESULT_FIELDS)
+    
+    # Repeated labels as categoricals (int codes) - cheaper masks and groupbys.
+    # Categories keep first-appearance order so reports list them as before.
+    for col in CATEGORICAL_FIELDS:
+        df[col] = pd.Categorical(df[col], categories=pd.unique(df[col]))
     csv_path = output_dir / 'filtering_benchmark_results.csv'
     df.to_csv(csv_path, index=False)
     
     print(f"\nResults saved to: {csv_path}")
     
+    # Typed columnar copy for downstream analysis
+    try:
+        parquet_path = output_dir / 'filtering_benchmark_results.parquet'
+        df.to_parquet(parquet_path, index=False, compression='zstd')
+        print(f"Results saved to: {parquet_path}")
+    except (ImportError, ValueError, TypeError):
+        pass  # No pyarrow, or column data pyarrow cannot store
+    
     return df
 
 
+def align_categories(dataframes: list) -> list:
+    """
+    Give the categorical columns of several results frames the same categories.
+    
+    pd.concat only keeps a categorical column (and merges its int codes) when
+    every frame has identical categories; otherwise it falls back to object
+    dtype and re-boxes every label.
+    
+    Args:
+        dataframes: Results frames built by save_results_to_csv
+    
+    Returns:
+        The frames with unified categories, in the same order
+    """
+    for col in CATEGORICAL_FIELDS:
+        categories = pd.unique(pd.concat([pd.Series(df[col].cat.categories) for df in dataframes]))
+        dataframes = [df.assign(**{col: df[col].cat.set_categories(categories)}) for df in dataframes]
+    return dataframes
+
+
 def save_results_to_json(results: dict, output_dir: Path):
     """
     Save detailed benchmark results to JSON.
     
     Args:
         results: Dictionary of benchmark results
-        output_dir: Directory to save results
+        output_dir: Directory to save results (must already exist)
     """
-    output_dir.mkdir(exist_ok=True, parents=True)
     
     json_path = output_dir / 'filtering_benchmark_detailed.json'
     
-    with open(json_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    # orjson (compiled) when installed; same indented layout as json.dump
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"Detailed results saved to: {json_path}")
 
@@ -98,73 +164,79 @@ def generate_report(df: pd.DataFrame, output_dir: Path):
     
     Args:
         df: DataFrame with benchmark results
-        output_dir: Directory to save report
+        output_dir: Directory to save report (must already exist)
     """
     report_path = output_dir / 'filtering_benchmark_report.txt'
     
-    with open(report_path, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("FILTERING BENCHMARK REPORT\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Summary statistics
-        f.write("SUMMARY STATISTICS\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"Total Tests Run: {len(df)}\n")
-        f.write(f"Data Structures: {', '.join(df['tree_type'].unique())}\n")
-        f.write(f"Datasets: {', '.join(df['dataset'].unique())}\n\n")
-        
-        # Performance by tree type
-        f.write("\nPERFORMANCE BY TREE TYPE\n")
-        f.write("-" * 80 + "\n")
-        
-        for tree_type in df['tree_type'].unique():
-            tree_df = df[df['tree_type'] == tree_type]
-            avg_time = tree_df['avg_time_ms'].mean()
-            avg_memory = tree_df['memory_kb'].mean()
-            
-            f.write(f"\n{tree_type}:\n")
-            f.write(f"  Average Time: {avg_time:.3f}ms\n")
-            f.write(f"  Average Memory: {avg_memory:.2f}KB\n")
-            f.write(f"  Tests Run: {len(tree_df)}\n")
+    # Collect the report text and write it in one go
+    parts = []
+    parts.append("=" * 80 + "\n")
+    parts.append("FILTERING BENCHMARK REPORT\n")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    parts.append("=" * 80 + "\n\n")
+    
+    # Summary statistics
+    parts.append("SUMMARY STATISTICS\n")
+    parts.append("-" * 80 + "\n")
+    parts.append(f"Total Tests Run: {len(df)}\n")
+    parts.append(f"Data Structures: {', '.join(df['tree_type'].unique())}\n")
+    parts.append(f"Datasets: {', '.join(df['dataset'].unique())}\n\n")
+    
+    # Performance by tree type
+    parts.append("\nPERFORMANCE BY TREE TYPE\n")
+    parts.append("-" * 80 + "\n")
+    
+    tree_summary = df.groupby('tree_type', observed=True, sort=False).agg(
+        avg_time=('avg_time_ms', 'mean'),
+        avg_memory=('memory_kb', 'mean'),
+        tests=('avg_time_ms', 'size')
+    )
+    
+    for row in tree_summary.itertuples():
+        parts.append(f"\n{row.Index}:\n")
+        parts.append(f"  Average Time: {row.avg_time:.3f}ms\n")
+        parts.append(f"  Average Memory: {row.avg_memory:.2f}KB\n")
+        parts.append(f"  Tests Run: {row.tests}\n")
+    
+    # Best performers by operation
+    parts.append("\n\nBEST PERFORMERS BY OPERATION\n")
+    parts.append("-" * 80 + "\n")
+    
+    by_operation = df.groupby('operation', observed=True, sort=False)
+    fastest_rows = df.loc[by_operation['avg_time_ms'].idxmin()]
+    least_memory_rows = df.loc[by_operation['memory_kb'].idxmin()]
+    
+    for fastest, least_memory in zip(fastest_rows.itertuples(), least_memory_rows.itertuples()):
+        parts.append(f"\n{fastest.operation}:\n")
+        parts.append(f"  Fastest: {fastest.tree_type} ({fastest.avg_time_ms:.3f}ms)\n")
+        parts.append(f"  Least Memory: {least_memory.tree_type}\n")
+    
+    # Detailed results by test type
+    parts.append("\n\nDETAILED RESULTS BY TEST TYPE\n")
+    parts.append("=" * 80 + "\n")
+    
+    for test_type in df['test_type'].cat.categories:
+        parts.append(f"\n{test_type.replace('_', ' ').title()}\n")
+        parts.append("-" * 80 + "\n\n")
         
-        # Best performers by operation
-        f.write("\n\nBEST PERFORMERS BY OPERATION\n")
-        f.write("-" * 80 + "\n")
+        test_df = df[df['test_type'] == test_type]
         
-        for operation in df['operation'].unique():
-            op_df = df[df['operation'] == operation]
-            fastest = op_df.loc[op_df['avg_time_ms'].idxmin()]
+        # Group by filter params
+        for params in test_df['filter_params'].unique():
+            param_df = test_df[test_df['filter_params'] == params]
             
-            f.write(f"\n{operation}:\n")
-            f.write(f"  Fastest: {fastest['tree_type']} ({fastest['avg_time_ms']:.3f}ms)\n")
-            f.write(f"  Least Memory: {op_df.loc[op_df['memory_kb'].idxmin()]['tree_type']}\n")
-        
-        # Detailed results by test type
-        f.write("\n\nDETAILED RESULTS BY TEST TYPE\n")
-        f.write("=" * 80 + "\n")
-        
-        for test_type in df['test_type'].unique():
-            f.write(f"\n{test_type.replace('_', ' ').title()}\n")
-            f.write("-" * 80 + "\n\n")
+            parts.append(f"\nFilter: {params}\n")
+            parts.append(f"{'Tree':12} | {'Time (ms)':>12} | {'Memory (KB)':>12} | {'Results':>10} | {'Selectivity':>12}\n")
+            parts.append("-" * 80 + "\n")
             
-            test_df = df[df['test_type'] == test_type]
+            parts.append(param_df[REPORT_TABLE_COLUMNS].to_string(
+                index=False, header=False, formatters=REPORT_TABLE_FORMATTERS
+            ) + "\n")
             
-            # Group by filter params
-            for params in test_df['filter_params'].unique():
-                param_df = test_df[test_df['filter_params'] == params]
-                
-                f.write(f"\nFilter: {params}\n")
-                f.write(f"{'Tree':12} | {'Time (ms)':>12} | {'Memory (KB)':>12} | {'Results':>10} | {'Selectivity':>12}\n")
-                f.write("-" * 80 + "\n")
-                
-                for _, row in param_df.iterrows():
-                    f.write(f"{row['tree_type']:12} | {row['avg_time_ms']:12.3f} | "
-                           f"{row['memory_kb']:12.2f} | {row['results_count']:10,} | "
-                           f"{row['selectivity_percent']:11.2f}%\n")
-                
-                f.write("\n")
+            parts.append("\n")
+    
+    with open(report_path, 'w') as f:
+        f.write(''.join(parts))
     
     print(f"📄 Report saved to: {report_path}")
 
@@ -192,6 +264,7 @@ def run_dataset_experiments(dataset_name: str, output_dir: Path):
         print_comparison_summary(results)
         
         # Save results
+        # Created once here; the save/report helpers below assume it exists
         dataset_output = output_dir / dataset_name
         dataset_output.mkdir(exist_ok=True, parents=True)
         
@@ -246,12 +319,24 @@ def main():
     output_dir = Path(__file__).parent.parent / 'results' / 'filtering'
     output_dir.mkdir(exist_ok=True, parents=True)
     
-    # Run experiments for each available dataset
+    # Run experiments for each available dataset. Datasets are independent
+    # (own tree files, own output subdirectory), so each runs in its own
+    # process and loads its own trees.
+    completed = {}
+    with ProcessPoolExecutor(max_workers=min(4, len(available))) as executor:
+        futures = {
+            executor.submit(run_dataset_experiments, dataset_name, output_dir): dataset_name
+            for dataset_name in available
+        }
+        for future in as_completed(futures):
+            completed[futures[future]] = future.result()
+    
+    # Collect in dataset order so the combined CSV is deterministic
     all_results = {}
     all_dataframes = []
     
     for dataset_name in available:
-        results, df = run_dataset_experiments(dataset_name, output_dir)
+        results, df = completed[dataset_name]
         if results and df is not None:
             all_results[dataset_name] = results
             all_dataframes.append(df)
@@ -262,7 +347,9 @@ def main():
         print("GENERATING COMBINED REPORT")
         print("=" * 80)
         
-        combined_df = pd.concat(all_dataframes, ignore_index=True)
+        # Same columns and categories in every frame, so concat stacks the
+        # columns as they are (categoricals stay categorical, no object fallback)
+        combined_df = pd.concat(align_categories(all_dataframes), ignore_index=True)
         combined_df.to_csv(output_dir / 'all_datasets_combined.csv', index=False)
         
         print(f"\nSUCCESS: All experiments completed!")
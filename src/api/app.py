@@ -328,37 +328,42 @@ def filter_by_rating():
         
         tracker = ComparisonTracker()
         
-        # Monkey-patch comparison tracking for range search
-        original_range_search = None
+        # Comparison-tracking copy of the trees' range walk. It is called
+        # directly rather than patched onto the tree, since the trees are
+        # shared (load_trees caches them) across concurrent requests
+        tracked_range_search = None
         if hasattr(tree, '_range_search'):
-            original_range_search = tree._range_search
-            
             # Check if tree uses NIL sentinel (Red-Black tree) or None (AVL/BST)
             uses_nil = hasattr(tree, 'NIL')
             
             def tracked_range_search(node, min_rating, max_rating, results):
                 # Handle both NIL sentinel (Red-Black) and None (AVL/BST)
-                if uses_nil:
-                    if node == tree.NIL:
+                nil = tree.NIL if uses_nil else None
+                
+                # Same walk as the trees' _range_search: descend to the first
+                # rating >= min_rating, then follow inorder successors
+                stack = []
+                while True:
+                    while node is not nil:
+                        tracker.add(1)
+                        if node.rating >= min_rating:
+                            stack.append(node)
+                            node = node.left
+                        else:
+                            node = node.right
+                    
+                    if not stack:
                         return
-                else:
-                    if node is None:
+                    node = stack.pop()
+                    tracker.add(1)
+                    if node.rating > max_rating:
                         return
-                
-                tracker.add(1)
-                if min_rating < node.rating:
-                    tracked_range_search(node.left, min_rating, max_rating, results)
-                if min_rating <= node.rating <= max_rating:
+                    
                     results.append(node.data)
-                    tracker.add(1)
-                if max_rating > node.rating:
-                    tracked_range_search(node.right, min_rating, max_rating, results)
-            
-            # Temporarily replace method
-            tree._range_search = tracked_range_search
+                    node = node.right
         
         # Perform query
-        # HashMap doesn't have _range_search, so skip monkey-patching for it
+        # HashMap doesn't have _range_search, so it tracks its own comparisons
         if structure_type == 'HashMap':
             # HashMap uses filter_by_rating directly, which tracks comparisons internally
             # Reset comparisons before query to get accurate count for this query only
@@ -370,6 +375,10 @@ def filter_by_rating():
                 comparisons = tree.get_total_comparisons() if hasattr(tree, 'get_total_comparisons') else len(results) * 2
             else:
                 results = []
+        elif tracked_range_search is not None and getattr(tree, '_sorted_ratings', None) is None:
+            # (trees from build_from_sorted answer from their sorted arrays instead)
+            results = []
+            tracked_range_search(tree.root, min_rating, max_rating, results)
         elif hasattr(tree, 'get_range'):
             results = tree.get_range(min_rating, max_rating)
         elif hasattr(tree, 'filter_by_rating'):
@@ -377,10 +386,6 @@ def filter_by_rating():
         else:
             results = []
         
-        # Restore original method
-        if original_range_search:
-            tree._range_search = original_range_search
-        
         # Use tracked comparisons if available, otherwise estimate
         if structure_type != 'HashMap':
             comparisons = tracker.count if tracker.count > 0 else len(results) * 2  # Estimate
@@ -4,11 +4,19 @@ Nodes are ordered by overall_rating with automatic balancing.
 """
 
 import sys
+from operator import itemgetter
+
+import numpy as np
+
+from .ordered_tree import OrderedTreeMixin, apply_field_filters
 
 
 class AVLNode:
     """Node in an AVL Tree."""
     
+    # Fixed attribute layout: no per-node __dict__, faster field access
+    __slots__ = ('rating', 'data', 'left', 'right', 'height')
+    
     def __init__(self, rating, data):
         """
         Initialize an AVL node.
@@ -24,7 +32,7 @@ class AVLNode:
         self.height = 1
 
 
-class AVLTree:
+class AVLTree(OrderedTreeMixin):
     """AVL Tree (self-balancing BST) for storing records ordered by rating."""
     
     def __init__(self):
@@ -33,6 +41,10 @@ class AVLTree:
         self.size = 0
         self._cached_memory = None
         self._memory_dirty = True
+        # Sorted rating/record arrays set by build_from_sorted, dropped on insert
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None  # filter_by_field 'contains' cache
     
     def _get_height(self, node):
         """Get height of a node."""
@@ -40,12 +52,6 @@ class AVLTree:
             return 0
         return node.height
     
-    def _get_balance(self, node):
-        """Get balance factor of a node."""
-        if node is None:
-            return 0
-        return self._get_height(node.left) - self._get_height(node.right)
-    
     def _rotate_right(self, y):
         """Perform right rotation."""
         x = y.left
@@ -54,8 +60,13 @@ class AVLTree:
         x.right = y
         y.left = T2
         
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
-        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
+        # Heights read inline and y's new height reused for x (no max() calls)
+        t2_height = T2.height if T2 is not None else 0
+        right_height = y.right.height if y.right is not None else 0
+        y_height = 1 + (t2_height if t2_height > right_height else right_height)
+        y.height = y_height
+        left_height = x.left.height if x.left is not None else 0
+        x.height = 1 + (left_height if left_height > y_height else y_height)
         
         return x
     
@@ -67,8 +78,13 @@ class AVLTree:
         y.left = x
         x.right = T2
         
-        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        # Heights read inline and x's new height reused for y (no max() calls)
+        left_height = x.left.height if x.left is not None else 0
+        t2_height = T2.height if T2 is not None else 0
+        x_height = 1 + (left_height if left_height > t2_height else t2_height)
+        x.height = x_height
+        right_height = y.right.height if y.right is not None else 0
+        y.height = 1 + (x_height if x_height > right_height else right_height)
         
         return y
     
@@ -80,126 +96,104 @@ class AVLTree:
             rating (float): Overall rating (key)
             data (dict): Complete row data
         """
-        self.root = self._insert_recursive(self.root, rating, data)
         self.size += 1
         self._memory_dirty = True
-    
-    def _insert_recursive(self, node, rating, data):
-        """Recursively insert and balance."""
-        # Standard BST insertion
-        if node is None:
-            return AVLNode(rating, data)
-        
-        if rating <= node.rating:
-            node.left = self._insert_recursive(node.left, rating, data)
-        else:
-            node.right = self._insert_recursive(node.right, rating, data)
-        
-        # Update height
-        node.height = 1 + max(self._get_height(node.left), 
-                             self._get_height(node.right))
-        
-        # Get balance factor
-        balance = self._get_balance(node)
-        
-        # Left-Left Case
-        if balance > 1 and rating <= node.left.rating:
-            return self._rotate_right(node)
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None
         
-        # Right-Right Case
-        if balance < -1 and rating > node.right.rating:
-            return self._rotate_left(node)
+        if self.root is None:
+            self.root = AVLNode(rating, data)
+            return
         
-        # Left-Right Case
-        if balance > 1 and rating > node.left.rating:
-            node.left = self._rotate_left(node.left)
+        # Standard BST insertion, remembering the path as (node, went_left)
+        path = []
+        node = self.root
+        while node is not None:
+            went_left = rating <= node.rating
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
+        
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = AVLNode(rating, data)
+        else:
+            parent.right = AVLNode(rating, data)
+        
+        # Walk back up the path, updating heights and rebalancing. Stop as
+        # soon as a subtree keeps its old height: nothing above can change.
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i][0]
+            old_height = node.height
+            subtree = self._rebalance(node, rating)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1][1]:
+                    path[i - 1][0].left = subtree
+                else:
+                    path[i - 1][0].right = subtree
+                # An insert rotation restores the subtree's previous height
+                break
+            if node.height == old_height:
+                break
+    
+    def _rebalance(self, node, rating):
+        """Update height and rebalance after inserting rating below node."""
+        # Update height and balance factor from the child heights read once
+        left_height = node.left.height if node.left is not None else 0
+        right_height = node.right.height if node.right is not None else 0
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        balance = left_height - right_height
+        
+        # Balanced nodes (the common case) cost two comparisons
+        if balance > 1:
+            # Left-Right Case: straighten into Left-Left first
+            if rating > node.left.rating:
+                node.left = self._rotate_left(node.left)
+            # Left-Left Case
             return self._rotate_right(node)
         
-        # Right-Left Case
-        if balance < -1 and rating <= node.right.rating:
-            node.right = self._rotate_right(node.right)
+        if balance < -1:
+            # Right-Left Case: straighten into Right-Right first
+            if rating <= node.right.rating:
+                node.right = self._rotate_right(node.right)
+            # Right-Right Case
             return self._rotate_left(node)
         
         return node
     
-    def search(self, rating):
+    def build_from_sorted(self, records):
         """
-        Search for nodes with a specific rating.
+        Build a balanced tree from all records at once, replacing any contents.
         
-        Args:
-            rating (float): Rating to search for
-            
-        Returns:
-            list: All nodes with the given rating
-        """
-        results = []
-        self._search_recursive(self.root, rating, results)
-        return results
-    
-    def _search_recursive(self, node, rating, results):
-        """Recursively search for nodes."""
-        if node is None:
-            return
-        
-        if rating < node.rating:
-            self._search_recursive(node.left, rating, results)
-        elif rating > node.rating:
-            self._search_recursive(node.right, rating, results)
-        else:
-            results.append(node.data)
-            self._search_recursive(node.left, rating, results)
-            self._search_recursive(node.right, rating, results)
-    
-    def get_top_k(self, k):
-        """
-        Get the top K highest rated records.
+        Records are sorted by rating once and the tree is built by taking
+        the middle record as the root of each subtree, so no per-record
+        descent or rotation is needed.
         
         Args:
-            k (int): Number of top records to retrieve
-            
-        Returns:
-            list: Top K records sorted by rating (descending)
+            records (iterable): (rating, data) pairs, in any order
         """
-        all_nodes = []
-        self._inorder_traversal(self.root, all_nodes)
-        all_nodes.sort(key=lambda x: x['overall_rating'], reverse=True)
-        return all_nodes[:k]
-    
-    def get_range(self, min_rating, max_rating):
-        """
-        Get all records within a rating range.
-        
-        Args:
-            min_rating (float): Minimum rating (inclusive)
-            max_rating (float): Maximum rating (inclusive)
-            
-        Returns:
-            list: All records within the range
-        """
-        results = []
-        self._range_search(self.root, min_rating, max_rating, results)
-        return results
-    
-    def _range_search(self, node, min_rating, max_rating, results):
-        """Recursively search for nodes in range."""
-        if node is None:
-            return
-        
-        if min_rating < node.rating:
-            self._range_search(node.left, min_rating, max_rating, results)
-        
-        if min_rating <= node.rating <= max_rating:
-            results.append(node.data)
-        
-        if max_rating > node.rating:
-            self._range_search(node.right, min_rating, max_rating, results)
+        records = sorted(records, key=itemgetter(0))
+        self.root = self._build_balanced(records, 0, len(records) - 1)
+        self.size = len(records)
+        self._memory_dirty = True
+        self._sorted_ratings = np.array([r for r, _ in records], dtype=np.float64)
+        self._sorted_data = [d for _, d in records]
+        self._lowercase_index = None
     
-    def _inorder_traversal(self, node, result):
-        """Inorder traversal to get all nodes."""
-        if node is not None:
-            self._inorder_traversal(node.left, result)
-            result.append(node.data)
-            self._inorder_traversal(node.right, result)
+    def _build_balanced(self, records, lo, hi):
+        """Recursively build a subtree from sorted records[lo..hi]."""
+        if lo > hi:
+            return None
+        
+        mid = (lo + hi) // 2
+        node = AVLNode(*records[mid])
+        node.left = self._build_balanced(records, lo, mid - 1)
+        node.right = self._build_balanced(records, mid + 1, hi)
+        node.height = 1 + max(node.left.height if node.left is not None else 0,
+                              node.right.height if node.right is not None else 0)
+        return node
     
     def get_height(self):
         """Get the height of the tree."""
@@ -208,6 +202,10 @@ class AVLTree:
     def get_size(self):
         """Get the number of nodes in the tree."""
         return self.size
+    
+    def get_node_count(self):
+        """Get the number of nodes in O(1) (one node per record)."""
+        return self.size
 
     def get_memory_usage(self):
         """Get actual memory usage in bytes using sys.getsizeof with caching."""
@@ -217,22 +215,26 @@ class AVLTree:
         return self._cached_memory
 
     def _calculate_memory(self, node):
-        """Recursively calculate memory usage of the AVL tree."""
-        if node is None:
-            return 0
+        """Calculate memory usage of the AVL tree (iterative, explicit stack)."""
+        memory = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
 
-        # Size of the node object itself
-        memory = sys.getsizeof(node)
+            # Size of the node object itself
+            memory += sys.getsizeof(node)
 
-        # Size of the data stored in the node
-        memory += sys.getsizeof(node.data)
-        if isinstance(node.data, dict):
-            for key, value in node.data.items():
-                memory += sys.getsizeof(key) + sys.getsizeof(value)
+            # Size of the data stored in the node
+            memory += sys.getsizeof(node.data)
+            if isinstance(node.data, dict):
+                for key, value in node.data.items():
+                    memory += sys.getsizeof(key) + sys.getsizeof(value)
 
-        # Recursively calculate memory for children
-        memory += self._calculate_memory(node.left)
-        memory += self._calculate_memory(node.right)
+            # Children are added when popped
+            stack.append(node.left)
+            stack.append(node.right)
 
         return memory
     
@@ -257,57 +259,6 @@ class AVLTree:
         
         return self.get_range(min_rating, max_rating)
     
-    def filter_by_field(self, field_name, value=None, min_value=None, max_value=None, 
-                       condition='equals'):
-        """
-        Filter records by any non-indexed field (requires linear scan).
-        
-        Args:
-            field_name (str): Field name to filter by (e.g., 'recommended', 'cabin_flown')
-            value: Exact value to match (for condition='equals')
-            min_value: Minimum value (for condition='range')
-            max_value: Maximum value (for condition='range')
-            condition (str): 'equals', 'range', 'contains', 'greater_than', 'less_than'
-            
-        Returns:
-            list: Filtered records
-            
-        Time Complexity: O(n) - must scan all nodes
-        Space Complexity: O(m) where m is number of results
-        """
-        results = []
-        self._filter_by_field_recursive(self.root, field_name, value, min_value, 
-                                       max_value, condition, results)
-        return results
-    
-    def _filter_by_field_recursive(self, node, field_name, value, min_value, 
-                                   max_value, condition, results):
-        """Recursively filter nodes by field value."""
-        if node is None:
-            return
-        
-        # Traverse entire tree (inorder)
-        self._filter_by_field_recursive(node.left, field_name, value, min_value, 
-                                       max_value, condition, results)
-        
-        # Check if node matches filter
-        if field_name in node.data:
-            field_value = node.data[field_name]
-            
-            if condition == 'equals' and field_value == value:
-                results.append(node.data)
-            elif condition == 'range' and min_value <= field_value <= max_value:
-                results.append(node.data)
-            elif condition == 'contains' and value and str(value).lower() in str(field_value).lower():
-                results.append(node.data)
-            elif condition == 'greater_than' and field_value > value:
-                results.append(node.data)
-            elif condition == 'less_than' and field_value < value:
-                results.append(node.data)
-        
-        self._filter_by_field_recursive(node.right, field_name, value, min_value, 
-                                       max_value, condition, results)
-    
     def filter_multi_criteria(self, filters):
         """
         Apply multiple filters simultaneously.
@@ -336,18 +287,8 @@ class AVLTree:
             results = []
             self._inorder_traversal(self.root, results)
         
-        # Apply additional filters sequentially
-        for field, criteria in filters.items():
-            if field == 'rating':
-                continue  # Already applied
-            
-            if 'value' in criteria:
-                results = [r for r in results if r.get(field) == criteria['value']]
-            elif 'min' in criteria and 'max' in criteria:
-                results = [r for r in results 
-                          if criteria['min'] <= r.get(field, float('-inf')) <= criteria['max']]
-        
-        return results
+        # Apply the remaining filters in one fused pass
+        return apply_field_filters(results, filters)
     
     def __str__(self):
         """String representation of the AVL Tree."""
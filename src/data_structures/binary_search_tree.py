@@ -3,10 +3,19 @@ Binary Search Tree (BST) implementation for storing airline data.
 Nodes are ordered by overall_rating.
 """
 
+from operator import itemgetter
+
+import numpy as np
+
+from .ordered_tree import OrderedTreeMixin, apply_field_filters
+
 
 class BSTNode:
     """Node in a Binary Search Tree."""
     
+    # Fixed attribute layout: no per-node __dict__, faster field access
+    __slots__ = ('rating', 'data', 'left', 'right')
+    
     def __init__(self, rating, data):
         """
         Initialize a BST node.
@@ -21,13 +30,18 @@ class BSTNode:
         self.right = None
 
 
-class BinarySearchTree:
+class BinarySearchTree(OrderedTreeMixin):
     """Binary Search Tree for storing records ordered by rating."""
     
     def __init__(self):
         """Initialize an empty BST."""
         self.root = None
         self.size = 0
+        self._height = 0  # Nodes never move, so only the deepest insert matters
+        # Sorted rating/record arrays set by build_from_sorted, dropped on insert
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None  # filter_by_field 'contains' cache
     
     def insert(self, rating, data):
         """
@@ -37,123 +51,76 @@ class BinarySearchTree:
             rating (float): Overall rating (key)
             data (dict): Complete row data
         """
+        self.size += 1
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None
         if self.root is None:
             self.root = BSTNode(rating, data)
-            self.size += 1
-        else:
-            self._insert_recursive(self.root, rating, data)
-    
-    def _insert_recursive(self, node, rating, data):
-        """Recursively insert a node."""
-        if rating <= node.rating:
-            if node.left is None:
-                node.left = BSTNode(rating, data)
-                self.size += 1
-            else:
-                self._insert_recursive(node.left, rating, data)
-        else:
-            if node.right is None:
-                node.right = BSTNode(rating, data)
-                self.size += 1
-            else:
-                self._insert_recursive(node.right, rating, data)
-    
-    def search(self, rating):
-        """
-        Search for nodes with a specific rating.
-        
-        Args:
-            rating (float): Rating to search for
-            
-        Returns:
-            list: All nodes with the given rating
-        """
-        results = []
-        self._search_recursive(self.root, rating, results)
-        return results
-    
-    def _search_recursive(self, node, rating, results):
-        """Recursively search for nodes."""
-        if node is None:
+            self._height = 1
             return
         
-        if rating < node.rating:
-            self._search_recursive(node.left, rating, results)
-        elif rating > node.rating:
-            self._search_recursive(node.right, rating, results)
-        else:
-            results.append(node.data)
-            # Check both sides for duplicate ratings
-            self._search_recursive(node.left, rating, results)
-            self._search_recursive(node.right, rating, results)
-    
-    def get_top_k(self, k):
-        """
-        Get the top K highest rated records.
+        # Iterative descent (no recursion depth limit on skewed input)
+        node = self.root
+        depth = 2  # Height of the tree if the new node is a child of node
+        while True:
+            if rating <= node.rating:
+                if node.left is None:
+                    node.left = BSTNode(rating, data)
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = BSTNode(rating, data)
+                    break
+                node = node.right
+            depth += 1
         
-        Args:
-            k (int): Number of top records to retrieve
-            
-        Returns:
-            list: Top K records sorted by rating (descending)
-        """
-        all_nodes = []
-        self._inorder_traversal(self.root, all_nodes)
-        # Sort in descending order and return top k
-        all_nodes.sort(key=lambda x: x['overall_rating'], reverse=True)
-        return all_nodes[:k]
+        if depth > self._height:
+            self._height = depth
     
-    def get_range(self, min_rating, max_rating):
-        """
-        Get all records within a rating range.
-        
-        Args:
-            min_rating (float): Minimum rating (inclusive)
-            max_rating (float): Maximum rating (inclusive)
-            
-        Returns:
-            list: All records within the range
+    def build_from_sorted(self, records):
         """
-        results = []
-        self._range_search(self.root, min_rating, max_rating, results)
-        return results
-    
-    def _range_search(self, node, min_rating, max_rating, results):
-        """Recursively search for nodes in range."""
-        if node is None:
-            return
+        Build a balanced tree from all records at once, replacing any contents.
         
-        if min_rating < node.rating:
-            self._range_search(node.left, min_rating, max_rating, results)
+        Records are sorted by rating once and the tree is built by taking
+        the middle record as the root of each subtree, so no per-record
+        descent is needed.
         
-        if min_rating <= node.rating <= max_rating:
-            results.append(node.data)
-        
-        if max_rating > node.rating:
-            self._range_search(node.right, min_rating, max_rating, results)
-    
-    def _inorder_traversal(self, node, result):
-        """Inorder traversal to get all nodes."""
-        if node is not None:
-            self._inorder_traversal(node.left, result)
-            result.append(node.data)
-            self._inorder_traversal(node.right, result)
+        Args:
+            records (iterable): (rating, data) pairs, in any order
+        """
+        records = sorted(records, key=itemgetter(0))
+        self.root = self._build_balanced(records, 0, len(records) - 1)
+        self.size = len(records)
+        self._height = len(records).bit_length()
+        self._sorted_ratings = np.array([r for r, _ in records], dtype=np.float64)
+        self._sorted_data = [d for _, d in records]
+        self._lowercase_index = None
+    
+    def _build_balanced(self, records, lo, hi):
+        """Recursively build a subtree from sorted records[lo..hi]."""
+        if lo > hi:
+            return None
+        
+        mid = (lo + hi) // 2
+        node = BSTNode(*records[mid])
+        node.left = self._build_balanced(records, lo, mid - 1)
+        node.right = self._build_balanced(records, mid + 1, hi)
+        return node
     
     def get_height(self):
-        """Get the height of the tree."""
-        return self._get_height_recursive(self.root)
-    
-    def _get_height_recursive(self, node):
-        """Recursively calculate tree height."""
-        if node is None:
-            return 0
-        return 1 + max(self._get_height_recursive(node.left), 
-                      self._get_height_recursive(node.right))
+        """Get the height of the tree in O(1) (tracked on insert)."""
+        return self._height
     
     def get_size(self):
         """Get the number of nodes in the tree."""
         return self.size
     
+    def get_node_count(self):
+        """Get the number of nodes in O(1) (one node per record)."""
+        return self.size
+    
     def filter_by_rating(self, min_rating=None, max_rating=None):
         """
         Filter records by rating range (uses indexed tree structure).
@@ -175,57 +142,6 @@ class BinarySearchTree:
         
         return self.get_range(min_rating, max_rating)
     
-    def filter_by_field(self, field_name, value=None, min_value=None, max_value=None, 
-                       condition='equals'):
-        """
-        Filter records by any non-indexed field (requires linear scan).
-        
-        Args:
-            field_name (str): Field name to filter by (e.g., 'recommended', 'cabin_flown')
-            value: Exact value to match (for condition='equals')
-            min_value: Minimum value (for condition='range')
-            max_value: Maximum value (for condition='range')
-            condition (str): 'equals', 'range', 'contains', 'greater_than', 'less_than'
-            
-        Returns:
-            list: Filtered records
-            
-        Time Complexity: O(n) - must scan all nodes
-        Space Complexity: O(m) where m is number of results
-        """
-        results = []
-        self._filter_by_field_recursive(self.root, field_name, value, min_value, 
-                                       max_value, condition, results)
-        return results
-    
-    def _filter_by_field_recursive(self, node, field_name, value, min_value, 
-                                   max_value, condition, results):
-        """Recursively filter nodes by field value."""
-        if node is None:
-            return
-        
-        # Traverse entire tree (inorder)
-        self._filter_by_field_recursive(node.left, field_name, value, min_value, 
-                                       max_value, condition, results)
-        
-        # Check if node matches filter
-        if field_name in node.data:
-            field_value = node.data[field_name]
-            
-            if condition == 'equals' and field_value == value:
-                results.append(node.data)
-            elif condition == 'range' and min_value <= field_value <= max_value:
-                results.append(node.data)
-            elif condition == 'contains' and value and str(value).lower() in str(field_value).lower():
-                results.append(node.data)
-            elif condition == 'greater_than' and field_value > value:
-                results.append(node.data)
-            elif condition == 'less_than' and field_value < value:
-                results.append(node.data)
-        
-        self._filter_by_field_recursive(node.right, field_name, value, min_value, 
-                                       max_value, condition, results)
-    
     def filter_multi_criteria(self, filters):
         """
         Apply multiple filters simultaneously.
@@ -254,18 +170,8 @@ class BinarySearchTree:
             results = []
             self._inorder_traversal(self.root, results)
         
-        # Apply additional filters sequentially
-        for field, criteria in filters.items():
-            if field == 'rating':
-                continue  # Already applied
-            
-            if 'value' in criteria:
-                results = [r for r in results if r.get(field) == criteria['value']]
-            elif 'min' in criteria and 'max' in criteria:
-                results = [r for r in results 
-                          if criteria['min'] <= r.get(field, float('-inf')) <= criteria['max']]
-        
-        return results
+        # Apply the remaining filters in one fused pass
+        return apply_field_filters(results, filters)
     
     def __str__(self):
         """String representation of the BST."""
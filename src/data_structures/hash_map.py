@@ -22,7 +22,8 @@ class HashMap:
         """
         self.capacity = initial_capacity
         self.load_factor = load_factor
-        self.size = 0
+        self.size = 0  # Number of distinct ratings (bucket entries)
+        self._record_count = 0  # Number of records across all entries
         self.buckets = [[] for _ in range(self.capacity)]
         self.comparisons = 0
         self._cached_memory = None  # Cached memory calculation
@@ -95,8 +96,57 @@ class HashMap:
             self._resize()
 
         self._insert_internal(rating, data)
+        self._record_count += 1
         self._memory_dirty = True  # Mark memory cache as dirty after insert
     
+    def bulk_insert(self, records):
+        """
+        Insert many records at once.
+        
+        Records are grouped by rating first, the table is grown once to fit
+        all new ratings, and each rating's records are then attached to its
+        bucket entry in one step. Produces the same rating -> records mapping
+        as calling insert() for every record, without the per-record resize
+        checks and bucket scans.
+        
+        Args:
+            records (iterable): (rating, data) pairs
+        """
+        grouped = {}
+        last_rating = None
+        for rating, data in records:
+            if rating is not None:
+                grouped.setdefault(rating, []).append(data)
+                self._record_count += 1
+                last_rating = rating
+        
+        # Only ratings not already in the table add entries
+        new_ratings = {
+            rating for rating in grouped
+            if all(existing != rating for existing, _ in self.buckets[self._hash(rating)])
+        }
+        
+        # Grow up front instead of doubling repeatedly while inserting. insert()
+        # checks before each record, so its last check sees every new entry
+        # except the last record's own (if it is one) -- match that capacity
+        if grouped:
+            last_is_new = last_rating in new_ratings and len(grouped[last_rating]) == 1
+            while (self.size + len(new_ratings) - last_is_new) / self.capacity >= self.load_factor:
+                self._resize()
+        
+        for rating, data_list in grouped.items():
+            bucket = self.buckets[self._hash(rating)]
+            for existing_rating, existing_list in bucket:
+                self.comparisons += 1
+                if existing_rating == rating:
+                    existing_list.extend(data_list)
+                    break
+            else:
+                bucket.append((rating, data_list))
+                self.size += 1
+        
+        self._memory_dirty = True
+    
     def get_range(self, min_rating, max_rating):
         """
         Get all records within a rating range.
@@ -146,11 +196,7 @@ class HashMap:
     
     def get_size(self):
         """Get the total number of records in the HashMap."""
-        total = 0
-        for bucket in self.buckets:
-            for rating, data_list in bucket:
-                total += len(data_list)
-        return total
+        return self._record_count
     
     def get_height(self):
         """HashMap doesn't have a height concept, return 0."""
@@ -0,0 +1,400 @@
+"""
+Shared read paths for the rating-ordered binary trees (BST, AVL, Red-Black).
+All three keep nodes with rating/data/left/right, so search, top-k, range
+and inorder walks are implemented once here, iteratively.
+"""
+
+import numpy as np
+
+
+def apply_field_filters(records, filters):
+    """
+    Keep the records that match every non-rating criterion in filters.
+    
+    The criteria are fused into one generated list comprehension, so the
+    candidates are scanned once with all checks inlined, instead of once
+    per field. Field names and values are bound as variables, never pasted
+    into the source.
+    
+    Args:
+        records (list): Candidate records (already rating-filtered)
+        filters (dict): Same format as filter_multi_criteria
+    
+    Returns:
+        list: Records matching all criteria, in their original order
+    """
+    conditions = []
+    env = {'records': records, '_neg_inf': float('-inf')}
+    for i, (field, criteria) in enumerate(filters.items()):
+        if field == 'rating':
+            continue  # Applied through the tree
+        
+        env[f'f{i}'] = field
+        if 'value' in criteria:
+            env[f'v{i}'] = criteria['value']
+            conditions.append(f'r.get(f{i}) == v{i}')
+        elif 'min' in criteria and 'max' in criteria:
+            env[f'lo{i}'] = criteria['min']
+            env[f'hi{i}'] = criteria['max']
+            conditions.append(f'lo{i} <= r.get(f{i}, _neg_inf) <= hi{i}')
+    
+    if not conditions:
+        return records
+    return eval('[r for r in records if ' + ' and '.join(conditions) + ']', env)
+
+
+def filter_records_by_field(records, field_name, value=None, min_value=None,
+                            max_value=None, condition='equals'):
+    """
+    Keep the records whose field_name satisfies condition (see filter_by_field).
+    
+    The condition is dispatched once, then a single comprehension specialised
+    to it scans the records, instead of re-checking the condition per record.
+    Records without field_name never match; an unknown condition matches nothing.
+    """
+    if condition == 'equals':
+        return [r for r in records if field_name in r and r[field_name] == value]
+    if condition == 'range':
+        return [r for r in records
+                if field_name in r and min_value <= r[field_name] <= max_value]
+    if condition == 'contains':
+        if not value:
+            return []
+        needle = str(value).lower()
+        return [r for r in records
+                if field_name in r and needle in str(r[field_name]).lower()]
+    if condition == 'greater_than':
+        return [r for r in records if field_name in r and r[field_name] > value]
+    if condition == 'less_than':
+        return [r for r in records if field_name in r and r[field_name] < value]
+    return []
+
+
+class OrderedTreeMixin:
+    """
+    Read operations shared by BinarySearchTree, AVLTree and RedBlackTree.
+    
+    Subclasses provide self.root, self._sorted_ratings and self._sorted_data
+    (the sidecar set by build_from_sorted) and self._lowercase_index (None
+    after any insert). Empty children are None unless the subclass sets
+    self._null to its sentinel node.
+    """
+    
+    _null = None
+    
+    def search(self, rating):
+        """
+        Search for nodes with a specific rating.
+        
+        Args:
+            rating (float): Rating to search for
+        
+        Returns:
+            list: All nodes with the given rating
+        """
+        if self._sorted_ratings is not None:
+            lo = np.searchsorted(self._sorted_ratings, rating, side='left')
+            hi = np.searchsorted(self._sorted_ratings, rating, side='right')
+            return self._sorted_data[lo:hi]
+        
+        results = []
+        nil = self._null
+        
+        # Plain descent to the first match; only duplicates need a stack
+        node = self.root
+        while node is not nil and node.rating != rating:
+            node = node.left if rating < node.rating else node.right
+        if node is nil:
+            return results
+        
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is nil:
+                continue
+            
+            if rating < node.rating:
+                stack.append(node.left)
+            elif rating > node.rating:
+                stack.append(node.right)
+            else:
+                results.append(node.data)
+                # Check both sides for duplicate ratings (left first)
+                stack.append(node.right)
+                stack.append(node.left)
+        return results
+    
+    def get_top_k(self, k):
+        """
+        Get the top K highest rated records.
+        
+        Args:
+            k (int): Number of top records to retrieve
+        
+        Returns:
+            list: Top K records sorted by rating (descending)
+        """
+        if self._sorted_data is not None:
+            return self._sorted_data[-k:][::-1] if k > 0 else []
+        
+        out = []
+        self._reverse_inorder_collect(self.root, k, out)
+        return out
+    
+    def _reverse_inorder_collect(self, node, k, out):
+        """Reverse inorder walk (right, node, left) that stops after k records."""
+        nil = self._null
+        stack = []
+        while (stack or node is not nil) and len(out) < k:
+            while node is not nil:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            out.append(node.data)
+            node = node.left
+    
+    def get_range(self, min_rating, max_rating):
+        """
+        Get all records within a rating range.
+        
+        Args:
+            min_rating (float): Minimum rating (inclusive)
+            max_rating (float): Maximum rating (inclusive)
+        
+        Returns:
+            list: All records within the range
+        """
+        if self._sorted_ratings is not None:
+            lo = np.searchsorted(self._sorted_ratings, min_rating, side='left')
+            hi = np.searchsorted(self._sorted_ratings, max_rating, side='right')
+            return self._sorted_data[lo:hi]
+        
+        results = []
+        self._range_search(self.root, min_rating, max_rating, results)
+        return results
+    
+    def _range_search(self, node, min_rating, max_rating, results):
+        """
+        Iteratively collect nodes in range, in ascending order.
+        
+        Descends once to the first rating >= min_rating (keeping the path on a
+        stack), then walks inorder successors until a rating passes max_rating.
+        """
+        nil = self._null
+        stack = []
+        while True:
+            # Push the left spine of nodes that can still be >= min_rating
+            while node is not nil:
+                if node.rating >= min_rating:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            
+            if not stack:
+                return
+            node = stack.pop()
+            if node.rating > max_rating:
+                return
+            
+            results.append(node.data)
+            node = node.right
+    
+    def _inorder_traversal(self, node, result):
+        """Iterative inorder traversal to get all nodes."""
+        nil = self._null
+        stack = []
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.data)
+            node = node.right
+    
+    def filter_by_field(self, field_name, value=None, min_value=None, max_value=None, 
+                       condition='equals'):
+        """
+        Filter records by any non-indexed field (requires linear scan).
+        
+        Args:
+            field_name (str): Field name to filter by (e.g., 'recommended', 'cabin_flown')
+            value: Exact value to match (for condition='equals')
+            min_value: Minimum value (for condition='range')
+            max_value: Maximum value (for condition='range')
+            condition (str): 'equals', 'range', 'contains', 'greater_than', 'less_than'
+            
+        Returns:
+            list: Filtered records
+            
+        Time Complexity: O(n) - must scan all nodes
+        Space Complexity: O(m) where m is number of results
+        """
+        if condition == 'contains' and value:
+            records, lowered = self._get_lowercase_index(field_name)
+            needle = str(value).lower()
+            return [r for r, text in zip(records, lowered) if needle in text]
+        
+        # Traverse entire tree (iterative inorder), then filter in one pass
+        records = []
+        self._inorder_traversal(self.root, records)
+        return filter_records_by_field(records, field_name, value, min_value,
+                                       max_value, condition)
+    
+    def _get_lowercase_index(self, field_name):
+        """
+        Inorder records that have field_name, with str(value).lower() for each.
+        
+        Built on the first 'contains' query for a field and kept until the
+        next insert, so repeated queries skip the per-record lowercasing.
+        """
+        if self._lowercase_index is None:
+            self._lowercase_index = {}
+        entry = self._lowercase_index.get(field_name)
+        if entry is None:
+            records = []
+            self._inorder_traversal(self.root, records)
+            records = [r for r in records if field_name in r]
+            entry = (records, [str(r[field_name]).lower() for r in records])
+            self._lowercase_index[field_name] = entry
+        return entry
+    
+    def __getstate__(self):
+        """
+        Pickle the nodes as flat preorder rows plus child index lists.
+        
+        Pickling linked nodes directly recurses once per tree level, which
+        overflows the stack on tall (unbalanced BST) trees; flat lists pickle
+        at constant depth. Parent pointers are rebuilt on load.
+        """
+        state = self.__dict__.copy()
+        nil = self._null
+        order = []
+        stack = [self.root] if self.root is not nil else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.right is not nil:
+                stack.append(node.right)
+            if node.left is not nil:
+                stack.append(node.left)
+        
+        if not order:
+            state['root'] = None
+            return state
+        
+        node_class = type(order[0])
+        fields = [f for f in node_class.__slots__ if f not in ('left', 'right', 'parent')]
+        position = {id(node): i for i, node in enumerate(order)}
+        state['root'] = (
+            node_class,
+            fields,
+            [tuple([getattr(node, f) for f in fields]) for node in order],
+            [position[id(node.left)] if node.left is not nil else -1 for node in order],
+            [position[id(node.right)] if node.right is not nil else -1 for node in order],
+        )
+        return state
+    
+    def __setstate__(self, state):
+        """Restore attributes and relink the nodes saved by __getstate__."""
+        flat = state.pop('root')
+        self.__dict__.update(state)
+        nil = self._null
+        if flat is None:
+            self.root = nil
+            return
+        
+        node_class, fields, rows, lefts, rights = flat
+        nodes = []
+        for row in rows:
+            node = node_class.__new__(node_class)
+            for field, value in zip(fields, row):
+                setattr(node, field, value)
+            nodes.append(node)
+        
+        has_parent = 'parent' in node_class.__slots__
+        for node, left, right in zip(nodes, lefts, rights):
+            node.left = nodes[left] if left >= 0 else nil
+            node.right = nodes[right] if right >= 0 else nil
+            if has_parent:
+                if left >= 0:
+                    node.left.parent = node
+                if right >= 0:
+                    node.right.parent = node
+        
+        self.root = nodes[0]
+        if has_parent:
+            self.root.parent = nil
+    
+    def iter_inorder(self):
+        """
+        Lazily yield every record in ascending rating order.
+        
+        Uses O(h) memory; stopping early (break, islice) skips the rest of
+        the walk. The list-building methods keep their own loops, which are
+        faster when every record is wanted.
+        """
+        if self._sorted_data is not None:
+            yield from self._sorted_data
+            return
+        
+        nil = self._null
+        node = self.root
+        stack = []
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+    
+    def iter_descending(self):
+        """Lazily yield every record in descending rating order (O(h) memory)."""
+        if self._sorted_data is not None:
+            yield from reversed(self._sorted_data)
+            return
+        
+        nil = self._null
+        node = self.root
+        stack = []
+        while stack or node is not nil:
+            while node is not nil:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.data
+            node = node.left
+    
+    def iter_range(self, min_rating, max_rating):
+        """
+        Lazily yield records with min_rating <= rating <= max_rating, ascending.
+        
+        Same walk as _range_search, without building the result list.
+        """
+        if self._sorted_ratings is not None:
+            lo = np.searchsorted(self._sorted_ratings, min_rating, side='left')
+            hi = np.searchsorted(self._sorted_ratings, max_rating, side='right')
+            for i in range(lo, hi):
+                yield self._sorted_data[i]
+            return
+        
+        nil = self._null
+        node = self.root
+        stack = []
+        while True:
+            while node is not nil:
+                if node.rating >= min_rating:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            
+            if not stack:
+                return
+            node = stack.pop()
+            if node.rating > max_rating:
+                return
+            
+            yield node.data
+            node = node.right
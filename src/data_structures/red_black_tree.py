@@ -4,6 +4,11 @@ Nodes are ordered by overall_rating with self-balancing properties.
 """
 
 import sys
+from operator import itemgetter
+
+import numpy as np
+
+from .ordered_tree import OrderedTreeMixin, apply_field_filters
 
 
 class Color:
@@ -15,6 +20,10 @@ class Color:
 class RBNode:
     """Node in a Red-Black Tree."""
     
+    # Fixed attribute layout: no per-node __dict__, faster field access
+    __slots__ = ('rating', 'data', 'color', 'left', 'right', 'parent', 'height',
+                 'count')
+    
     def __init__(self, rating, data, color=Color.RED):
         """
         Initialize a Red-Black Tree node.
@@ -30,18 +39,27 @@ class RBNode:
         self.left = None
         self.right = None
         self.parent = None
+        self.height = 1
+        self.count = 1  # Nodes in this subtree (order statistics)
 
 
-class RedBlackTree:
+class RedBlackTree(OrderedTreeMixin):
     """Red-Black Tree (self-balancing BST) for storing records ordered by rating."""
     
     def __init__(self):
         """Initialize an empty Red-Black Tree."""
         self.NIL = RBNode(None, None, Color.BLACK)  # Sentinel node
+        self.NIL.height = 0
+        self.NIL.count = 0
+        self._null = self.NIL  # Empty children for the shared read paths
         self.root = self.NIL
         self.size = 0
         self._cached_memory = None
         self._memory_dirty = True
+        # Sorted rating/record arrays set by build_from_sorted, dropped on insert
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None  # filter_by_field 'contains' cache
     
     def insert(self, rating, data):
         """
@@ -55,12 +73,13 @@ class RedBlackTree:
         new_node.left = self.NIL
         new_node.right = self.NIL
         
-        parent = None
+        parent = self.NIL  # The root's parent is the (black) sentinel
         current = self.root
         
         # Find the position to insert
-        while current != self.NIL:
+        while current is not self.NIL:
             parent = current
+            current.count += 1  # The new node lands in this subtree
             if new_node.rating <= current.rating:
                 current = current.left
             else:
@@ -68,7 +87,7 @@ class RedBlackTree:
         
         new_node.parent = parent
         
-        if parent is None:
+        if parent is self.NIL:
             self.root = new_node
         elif new_node.rating <= parent.rating:
             parent.left = new_node
@@ -77,39 +96,60 @@ class RedBlackTree:
         
         self.size += 1
         self._memory_dirty = True
+        self._sorted_ratings = None
+        self._sorted_data = None
+        self._lowercase_index = None
+        self._update_heights(parent)
         self._fix_insert(new_node)
     
+    def _update_heights(self, node):
+        """Recompute heights from node towards the root after a change below it."""
+        while node is not self.NIL:
+            left_height = node.left.height
+            right_height = node.right.height
+            height = 1 + (left_height if left_height > right_height else right_height)
+            # Once a subtree keeps its height, nothing above it changes
+            if height == node.height:
+                return
+            node.height = height
+            node = node.parent
+    
     def _fix_insert(self, node):
         """Fix Red-Black Tree properties after insertion."""
-        while node.parent and node.parent.color == Color.RED:
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == Color.RED:
-                    node.parent.color = Color.BLACK
-                    uncle.color = Color.BLACK
-                    node.parent.parent.color = Color.RED
-                    node = node.parent.parent
-                else:
-                    if node == node.parent.right:
-                        node = node.parent
-                        self._rotate_left(node)
-                    node.parent.color = Color.BLACK
-                    node.parent.parent.color = Color.RED
-                    self._rotate_right(node.parent.parent)
+        while True:
+            # Read each relative once per iteration instead of re-walking
+            # node.parent.parent chains; the root's parent is the black NIL
+            parent = node.parent
+            if parent.color != Color.RED:
+                break
+            
+            grandparent = parent.parent
+            left_side = parent is grandparent.left
+            uncle = grandparent.right if left_side else grandparent.left
+            
+            if uncle.color == Color.RED:
+                parent.color = Color.BLACK
+                uncle.color = Color.BLACK
+                grandparent.color = Color.RED
+                node = grandparent
+            elif left_side:
+                if node is parent.right:
+                    node = parent
+                    self._rotate_left(node)
+                    parent = node.parent
+                parent.color = Color.BLACK
+                grandparent.color = Color.RED
+                self._rotate_right(grandparent)
+                self._update_heights(parent.parent)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == Color.RED:
-                    node.parent.color = Color.BLACK
-                    uncle.color = Color.BLACK
-                    node.parent.parent.color = Color.RED
-                    node = node.parent.parent
-                else:
-                    if node == node.parent.left:
-                        node = node.parent
-                        self._rotate_right(node)
-                    node.parent.color = Color.BLACK
-                    node.parent.parent.color = Color.RED
-                    self._rotate_left(node.parent.parent)
+                if node is parent.left:
+                    node = parent
+                    self._rotate_right(node)
+                    parent = node.parent
+                parent.color = Color.BLACK
+                grandparent.color = Color.RED
+                self._rotate_left(grandparent)
+                self._update_heights(parent.parent)
         
         self.root.color = Color.BLACK
     
@@ -118,12 +158,12 @@ class RedBlackTree:
         y = x.right
         x.right = y.left
         
-        if y.left != self.NIL:
+        if y.left is not self.NIL:
             y.left.parent = x
         
         y.parent = x.parent
         
-        if x.parent is None:
+        if x.parent is self.NIL:
             self.root = y
         elif x == x.parent.left:
             x.parent.left = y
@@ -132,18 +172,30 @@ class RedBlackTree:
         
         y.left = x
         x.parent = y
+        
+        # y now roots the subtree x used to; x keeps its remaining children
+        y.count = x.count
+        x.count = 1 + x.left.count + x.right.count
+        
+        # Only x and y change height; ancestors are left to _update_heights
+        left_height = x.left.height
+        right_height = x.right.height
+        x_height = 1 + (left_height if left_height > right_height else right_height)
+        x.height = x_height
+        right_height = y.right.height
+        y.height = 1 + (x_height if x_height > right_height else right_height)
     
     def _rotate_right(self, y):
         """Perform right rotation."""
         x = y.left
         y.left = x.right
         
-        if x.right != self.NIL:
+        if x.right is not self.NIL:
             x.right.parent = y
         
         x.parent = y.parent
         
-        if y.parent is None:
+        if y.parent is self.NIL:
             self.root = x
         elif y == y.parent.right:
             y.parent.right = x
@@ -152,100 +204,140 @@ class RedBlackTree:
         
         x.right = y
         y.parent = x
+        
+        # x now roots the subtree y used to; y keeps its remaining children
+        x.count = y.count
+        y.count = 1 + y.left.count + y.right.count
+        
+        # Only x and y change height; ancestors are left to _update_heights
+        left_height = y.left.height
+        right_height = y.right.height
+        y_height = 1 + (left_height if left_height > right_height else right_height)
+        y.height = y_height
+        left_height = x.left.height
+        x.height = 1 + (left_height if left_height > y_height else y_height)
     
-    def search(self, rating):
+    def build_from_sorted(self, records):
         """
-        Search for nodes with a specific rating.
+        Build a balanced tree from all records at once, replacing any contents.
+        
+        Records are sorted by rating once and the tree is built by taking
+        the middle record as the root of each subtree, so no per-record
+        descent or recoloring is needed.
         
         Args:
-            rating (float): Rating to search for
+            records (iterable): (rating, data) pairs, in any order
+        """
+        records = sorted(records, key=itemgetter(0))
+        # Every level but the deepest is full, so coloring only the deepest
+        # level red gives every root-to-NIL path the same black height
+        deepest = len(records).bit_length() - 1
+        self.root = self._build_balanced(records, 0, len(records) - 1,
+                                         0, deepest if deepest > 0 else -1)
+        self.root.parent = self.NIL
+        self.size = len(records)
+        self._memory_dirty = True
+        self._sorted_ratings = np.array([r for r, _ in records], dtype=np.float64)
+        self._sorted_data = [d for _, d in records]
+        self._lowercase_index = None
+    
+    def _build_balanced(self, records, lo, hi, depth, red_depth):
+        """Recursively build a subtree from sorted records[lo..hi]."""
+        if lo > hi:
+            return self.NIL
+        
+        mid = (lo + hi) // 2
+        rating, data = records[mid]
+        node = RBNode(rating, data,
+                      Color.RED if depth == red_depth else Color.BLACK)
+        node.left = self._build_balanced(records, lo, mid - 1, depth + 1, red_depth)
+        node.right = self._build_balanced(records, mid + 1, hi, depth + 1, red_depth)
+        if node.left is not self.NIL:
+            node.left.parent = node
+        if node.right is not self.NIL:
+            node.right.parent = node
+        node.height = 1 + max(node.left.height, node.right.height)
+        node.count = hi - lo + 1
+        return node
+    
+    def get_height(self):
+        """Get the height of the tree in O(1) (maintained on insert)."""
+        return self.root.height
+    
+    def get_size(self):
+        """Get the number of nodes in the tree."""
+        return self.size
+    
+    def get_node_count(self):
+        """Get the number of nodes in O(1) (one node per record)."""
+        return self.size
+    
+    def select(self, index):
+        """
+        Get the record at a position in ascending rating order, in O(log n).
+        
+        Args:
+            index (int): 0-based position (negative counts from the end)
             
         Returns:
-            list: All nodes with the given rating
+            dict: The record at that position
         """
-        results = []
-        self._search_recursive(self.root, rating, results)
-        return results
-    
-    def _search_recursive(self, node, rating, results):
-        """Recursively search for nodes."""
-        if node == self.NIL:
-            return
-        
-        if rating < node.rating:
-            self._search_recursive(node.left, rating, results)
-        elif rating > node.rating:
-            self._search_recursive(node.right, rating, results)
-        else:
-            results.append(node.data)
-            self._search_recursive(node.left, rating, results)
-            self._search_recursive(node.right, rating, results)
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("select index out of range")
+        
+        node = self.root
+        while True:
+            left_count = node.left.count
+            if index < left_count:
+                node = node.left
+            elif index == left_count:
+                return node.data
+            else:
+                index -= left_count + 1
+                node = node.right
     
-    def get_top_k(self, k):
+    def rank(self, rating):
         """
-        Get the top K highest rated records.
+        Count records with a rating strictly below the given one, in O(log n).
         
         Args:
-            k (int): Number of top records to retrieve
+            rating (float): Rating to rank
             
         Returns:
-            list: Top K records sorted by rating (descending)
+            int: Number of records with overall_rating < rating
         """
-        all_nodes = []
-        self._inorder_traversal(self.root, all_nodes)
-        all_nodes.sort(key=lambda x: x['overall_rating'], reverse=True)
-        return all_nodes[:k]
+        return self._count_below(rating, inclusive=False)
     
-    def get_range(self, min_rating, max_rating):
+    def count_range(self, min_rating, max_rating):
         """
-        Get all records within a rating range.
+        Count records within a rating range without collecting them, in O(log n).
         
         Args:
             min_rating (float): Minimum rating (inclusive)
             max_rating (float): Maximum rating (inclusive)
             
         Returns:
-            list: All records within the range
+            int: Number of records with min_rating <= rating <= max_rating
         """
-        results = []
-        self._range_search(self.root, min_rating, max_rating, results)
-        return results
-    
-    def _range_search(self, node, min_rating, max_rating, results):
-        """Recursively search for nodes in range."""
-        if node == self.NIL:
-            return
-        
-        if min_rating < node.rating:
-            self._range_search(node.left, min_rating, max_rating, results)
-        
-        if min_rating <= node.rating <= max_rating:
-            results.append(node.data)
-        
-        if max_rating > node.rating:
-            self._range_search(node.right, min_rating, max_rating, results)
-    
-    def _inorder_traversal(self, node, result):
-        """Inorder traversal to get all nodes."""
-        if node != self.NIL:
-            self._inorder_traversal(node.left, result)
-            result.append(node.data)
-            self._inorder_traversal(node.right, result)
-    
-    def get_height(self):
-        """Get the height of the tree."""
-        return self._get_height_recursive(self.root)
-    
-    def _get_height_recursive(self, node):
-        """Recursively calculate tree height."""
-        if node == self.NIL:
+        if min_rating > max_rating:
             return 0
-        return 1 + max(self._get_height_recursive(node.left), 
-                      self._get_height_recursive(node.right))
+        return (self._count_below(max_rating, inclusive=True)
+                - self._count_below(min_rating, inclusive=False))
     
-    def get_size(self):
-        """Get the number of nodes in the tree."""
-        return self.size
+    def _count_below(self, rating, inclusive):
+        """Count nodes with rating < (or <=) the given rating via subtree counts."""
+        total = 0
+        node = self.root
+        while node is not self.NIL:
+            if node.rating < rating or (inclusive and node.rating == rating):
+                # Left subtree keys are <= node.rating, so all of them count
+                total += node.left.count + 1
+                node = node.right
+            else:
+                node = node.left
+        return total
     
     def filter_by_rating(self, min_rating=None, max_rating=None):
         """
@@ -268,57 +360,6 @@ class RedBlackTree:
         
         return self.get_range(min_rating, max_rating)
     
-    def filter_by_field(self, field_name, value=None, min_value=None, max_value=None, 
-                       condition='equals'):
-        """
-        Filter records by any non-indexed field (requires linear scan).
-        
-        Args:
-            field_name (str): Field name to filter by (e.g., 'recommended', 'cabin_flown')
-            value: Exact value to match (for condition='equals')
-            min_value: Minimum value (for condition='range')
-            max_value: Maximum value (for condition='range')
-            condition (str): 'equals', 'range', 'contains', 'greater_than', 'less_than'
-            
-        Returns:
-            list: Filtered records
-            
-        Time Complexity: O(n) - must scan all nodes
-        Space Complexity: O(m) where m is number of results
-        """
-        results = []
-        self._filter_by_field_recursive(self.root, field_name, value, min_value, 
-                                       max_value, condition, results)
-        return results
-    
-    def _filter_by_field_recursive(self, node, field_name, value, min_value, 
-                                   max_value, condition, results):
-        """Recursively filter nodes by field value."""
-        if node == self.NIL:
-            return
-        
-        # Traverse entire tree (inorder)
-        self._filter_by_field_recursive(node.left, field_name, value, min_value, 
-                                       max_value, condition, results)
-        
-        # Check if node matches filter
-        if field_name in node.data:
-            field_value = node.data[field_name]
-            
-            if condition == 'equals' and field_value == value:
-                results.append(node.data)
-            elif condition == 'range' and min_value <= field_value <= max_value:
-                results.append(node.data)
-            elif condition == 'contains' and value and str(value).lower() in str(field_value).lower():
-                results.append(node.data)
-            elif condition == 'greater_than' and field_value > value:
-                results.append(node.data)
-            elif condition == 'less_than' and field_value < value:
-                results.append(node.data)
-        
-        self._filter_by_field_recursive(node.right, field_name, value, min_value, 
-                                       max_value, condition, results)
-    
     def filter_multi_criteria(self, filters):
         """
         Apply multiple filters simultaneously.
@@ -347,18 +388,8 @@ class RedBlackTree:
             results = []
             self._inorder_traversal(self.root, results)
         
-        # Apply additional filters sequentially
-        for field, criteria in filters.items():
-            if field == 'rating':
-                continue  # Already applied
-            
-            if 'value' in criteria:
-                results = [r for r in results if r.get(field) == criteria['value']]
-            elif 'min' in criteria and 'max' in criteria:
-                results = [r for r in results 
-                          if criteria['min'] <= r.get(field, float('-inf')) <= criteria['max']]
-        
-        return results
+        # Apply the remaining filters in one fused pass
+        return apply_field_filters(results, filters)
     
     def __str__(self):
         """String representation of the Red-Black Tree."""
@@ -6,6 +6,7 @@ Uses binary search for prefix matching.
 import bisect
 import time
 import sys
+from operator import itemgetter
 from utils.performance_tracker import _deep_getsizeof
 
 
@@ -50,6 +51,32 @@ class SortedArray:
         self.data.insert(insertion_point, (normalized_key, original_name, data))
         self.memory_usage += len(str(data)) + len(key_string) + 50  # Approximate
     
+    def bulk_insert(self, records):
+        """
+        Insert many records at once with a single sort.
+        
+        Produces the same array as calling insert() for every record (a
+        later record with an equal key lands before the earlier ones), in
+        O(n log n) instead of one list shift per record.
+        
+        Args:
+            records (iterable): (key_string, data) pairs
+        """
+        normalize = self._normalize_string
+        new_items = []
+        for key_string, data in records:
+            normalized_key = normalize(key_string)
+            if normalized_key:
+                new_items.append((normalized_key, str(key_string).strip(), data))
+                self.memory_usage += len(str(data)) + len(key_string) + 50  # Approximate
+        
+        if new_items:
+            # Reversed so the stable sort keeps insert()'s order for equal keys
+            new_items.reverse()
+            new_items.extend(self.data)
+            new_items.sort(key=itemgetter(0))
+            self.data = new_items
+    
     def search_prefix(self, prefix, max_results=10):
         """
         Search for all records with keys starting with the given prefix.
@@ -1,18 +1,27 @@
 """
 String Trie (Prefix Tree) implementation for autocomplete functionality.
 Stores strings (e.g., airline names) for fast prefix matching.
+
+The trie is path-compressed (radix/PATRICIA): each edge holds a substring
+rather than a single character, and a node is only split where two keys
+diverge, so long unique name tails cost one node instead of one per char.
 """
 
 import sys
+import time
+from collections import OrderedDict
 from utils.performance_tracker import _deep_getsizeof
 
 
 class StringTrieNode:
-    """Node in a String Trie."""
+    """Node in a String Trie, reached by the substring in edge_label."""
     
-    def __init__(self):
+    __slots__ = ('edge_label', 'children', 'data_list', 'is_end', 'comparisons')
+    
+    def __init__(self, edge_label=''):
         """Initialize a Trie node."""
-        self.children = {}  # char -> StringTrieNode
+        self.edge_label = edge_label  # Substring on the edge from the parent
+        self.children = {}  # first char of child's edge_label -> StringTrieNode
         self.data_list = []  # List of records ending at this node
         self.is_end = False
         self.comparisons = 0  # Track comparisons for this node
@@ -24,6 +33,13 @@ class StringTrie:
     Optimized for autocomplete/prefix matching.
     """
     
+    # Comparison counting, timing and memory reporting for the API metrics.
+    # Set to False to skip them when only the results are needed.
+    ENABLE_METRICS = True
+    
+    # Number of (prefix, max_results) lookups kept by search_prefix
+    PREFIX_CACHE_SIZE = 4096
+    
     def __init__(self):
         """Initialize an empty String Trie."""
         self.root = StringTrieNode()
@@ -31,6 +47,9 @@ class StringTrie:
         self.comparisons = 0  # Total comparisons across all operations
         self._cached_memory = None  # Cached memory calculation
         self._memory_dirty = True  # Flag to track if cache needs update
+        self._cached_height = None  # Cached height calculation
+        self._height_dirty = True  # Flag to track if height needs update
+        self._prefix_cache = OrderedDict()  # (prefix, max_results) -> (results, count), LRU order
     
     def _normalize_string(self, s):
         """Normalize string for insertion (lowercase, strip)."""
@@ -50,27 +69,94 @@ class StringTrie:
         if not key:
             return
         
+        comparisons = self._insert_key(key, data)
+        self.size += 1
+        if self.ENABLE_METRICS:
+            self.comparisons += comparisons
+        self._memory_dirty = True  # Mark memory cache as dirty after insert
+        self._height_dirty = True
+        if self._prefix_cache:
+            self._prefix_cache.clear()  # Cached prefix results are stale
+    
+    def bulk_insert(self, records):
+        """
+        Insert many records at once.
+        
+        Same result as calling insert() for every record, but the size,
+        comparison count and cache invalidation are updated once at the end
+        instead of per record.
+        
+        Args:
+            records (iterable): (key_string, data) pairs
+        """
+        normalize = self._normalize_string
+        insert_key = self._insert_key
+        inserted = 0
+        comparisons = 0
+        for key_string, data in records:
+            key = normalize(key_string)
+            if key:
+                comparisons += insert_key(key, data)
+                inserted += 1
+        
+        if not inserted:
+            return
+        self.size += inserted
+        if self.ENABLE_METRICS:
+            self.comparisons += comparisons
+        self._memory_dirty = True
+        self._height_dirty = True
+        self._prefix_cache.clear()
+    
+    def _insert_key(self, key, data):
+        """Store data under a normalized, non-empty key; returns comparisons made."""
         node = self.root
         comparisons = 0
+        i = 0
 
-        # Traverse/create path for each character
-        for char in key:
-            comparisons += 1
-            if char not in node.children:
-                node.children[char] = StringTrieNode()
-            node = node.children[char]
+        # Follow matching edges, splitting an edge where the key diverges
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                # No edge starts with this char: the rest of the key is one new edge
+                comparisons += len(key) - i
+                child = StringTrieNode(key[i:])
+                node.children[key[i]] = child
+                node = child
+                break
+
+            label = child.edge_label
+            if key.startswith(label, i):
+                matched = len(label)
+            else:
+                matched = 1  # First char already matched via the dict key
+                limit = min(len(label), len(key) - i)
+                while matched < limit and label[matched] == key[i + matched]:
+                    matched += 1
+                # Split: new node for the shared part, old child keeps the tail
+                middle = StringTrieNode(label[:matched])
+                child.edge_label = label[matched:]
+                middle.children[child.edge_label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+
+            comparisons += matched
+            node = child
+            i += matched
 
         # Store data at the end node
         node.is_end = True
         node.data_list.append(data)
-        self.size += 1
-        self.comparisons += comparisons
-        self._memory_dirty = True  # Mark memory cache as dirty after insert
+        return comparisons
     
     def search_prefix(self, prefix, max_results=10):
         """
         Search for all records with keys starting with the given prefix.
         
+        Results are cached per (prefix, max_results) until the next insert,
+        so repeated autocomplete keystrokes skip the traversal (a cache hit
+        reports 0 comparisons).
+        
         Args:
             prefix (str): Prefix to search for
             max_results (int): Maximum number of results to return
@@ -78,11 +164,12 @@ class StringTrie:
         Returns:
             tuple: (results_list, metrics_dict)
                 - results_list: List of matching records
-                - metrics_dict: Performance metrics (comparisons, time, etc.)
+                - metrics_dict: Performance metrics (comparisons, time, etc.),
+                  all zero except results_count when ENABLE_METRICS is False
         """
-        import time
-        start_time = time.perf_counter()
-        comparisons = 0
+        track = self.ENABLE_METRICS
+        if track:
+            start_time = time.perf_counter()
 
         normalized_prefix = self._normalize_string(prefix)
         if not normalized_prefix:
@@ -93,63 +180,106 @@ class StringTrie:
                 'results_count': 0
             }
 
-        node = self.root
+        cache_key = (normalized_prefix, max_results)
+        cached = self._prefix_cache.get(cache_key)
+        if cached is not None:
+            self._prefix_cache.move_to_end(cache_key)
+            results, results_count = cached
+            comparisons = 0
+        else:
+            results, results_count, comparisons = self._search_prefix_uncached(
+                normalized_prefix, max_results)
+            self._prefix_cache[cache_key] = (results, results_count)
+            if len(self._prefix_cache) > self.PREFIX_CACHE_SIZE:
+                self._prefix_cache.popitem(last=False)  # Drop least recently used
 
-        # Traverse to the prefix node
-        for char in normalized_prefix:
-            comparisons += 1
-            if char not in node.children:
-                # Prefix not found
-                elapsed = (time.perf_counter() - start_time) * 1000
-                return [], {
-                    'comparisons': comparisons,
-                    'time_ms': elapsed,
-                    'memory_bytes': self.get_memory_usage(),
-                    'results_count': 0
-                }
-            node = node.children[char]
-
-        # Collect all records under this prefix
-        results = []
-        comparisons = self._collect_records(node, results, comparisons, max_results)
+        if not track:
+            return list(results), self._empty_metrics(results_count)
 
         elapsed = (time.perf_counter() - start_time) * 1000
         self.comparisons += comparisons
 
-        return results[:max_results], {
+        return list(results), {
             'comparisons': comparisons,
             'time_ms': elapsed,
             'memory_bytes': self.get_memory_usage(),
-            'results_count': len(results),
+            'results_count': results_count,
             'memory_delta': 0  # Not tracking delta with sys.getsizeof
         }
     
+    def _search_prefix_uncached(self, normalized_prefix, max_results):
+        """
+        Walk the trie for a normalized prefix.
+        
+        Returns:
+            tuple: (results_tuple, results_count, comparisons)
+        """
+        comparisons = 0
+        node = self.root
+        i = 0
+
+        # Traverse edges to the node at or below the end of the prefix
+        while i < len(normalized_prefix):
+            child = node.children.get(normalized_prefix[i])
+            label = child.edge_label if child is not None else ''
+            if child is not None and normalized_prefix.startswith(label, i):
+                # Whole edge matches, keep going
+                comparisons += len(label)
+                i += len(label)
+                node = child
+            elif child is not None and label.startswith(normalized_prefix[i:]):
+                # Prefix ends part-way along this edge
+                comparisons += len(normalized_prefix) - i
+                node = child
+                break
+            else:
+                # Prefix not found (count matched chars plus the mismatch)
+                matched = 0
+                while child is not None and label[matched] == normalized_prefix[i + matched]:
+                    matched += 1
+                return (), 0, comparisons + matched + 1
+
+        # Collect all records under this prefix
+        results = []
+        comparisons = self._collect_records(node, results, comparisons, max_results)
+        return tuple(results[:max_results]), len(results), comparisons
+    
+    def _empty_metrics(self, results_count):
+        """Metrics dict returned when ENABLE_METRICS is False."""
+        return {
+            'comparisons': 0,
+            'time_ms': 0,
+            'memory_bytes': 0,
+            'results_count': results_count
+        }
+    
     def _collect_records(self, node, results, comparisons, max_results):
         """
-        Recursively collect all records from a node downwards.
+        Collect all records from a node downwards (iterative preorder).
         We collect ALL records from each node to allow proper averaging.
         The API will deduplicate by name and calculate averages.
         """
         if node is None:
             return comparisons
         
-        # Collect ALL records from this node if it's an end node
-        # This allows us to calculate proper averages across all reviews
-        comparisons += 1
-        if node.is_end and node.data_list:
-            # Add all records from this node (all reviews for this airline/airport/etc)
-            results.extend(node.data_list)
-            comparisons += len(node.data_list)
-        
-        # Stop if we have enough results
-        if len(results) >= max_results:
-            return comparisons
-        
-        # Traverse children to find more records
-        for child in node.children.values():
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            
+            # Collect ALL records from this node if it's an end node
+            # This allows us to calculate proper averages across all reviews
+            comparisons += 1
+            if node.is_end and node.data_list:
+                # Add all records from this node (all reviews for this airline/airport/etc)
+                results.extend(node.data_list)
+                comparisons += len(node.data_list)
+            
+            # Stop if we have enough results
             if len(results) >= max_results:
                 break
-            comparisons = self._collect_records(child, results, comparisons, max_results)
+            
+            # Reversed so children are still visited in insertion order
+            stack.extend(reversed(node.children.values()))
         
         return comparisons
     
@@ -158,15 +288,20 @@ class StringTrie:
         return self.size
     
     def get_height(self):
-        """Get the height of the trie."""
-        return self._get_height_recursive(self.root)
+        """Get the height of the trie with caching (recounted after inserts)."""
+        if self._height_dirty or self._cached_height is None:
+            self._cached_height = self._calculate_height()
+            self._height_dirty = False
+        return self._cached_height
     
-    def _get_height_recursive(self, node):
-        """Recursively calculate trie height."""
-        if not node.children:
-            return 0
-        return 1 + max(self._get_height_recursive(child) 
-                      for child in node.children.values())
+    def _calculate_height(self):
+        """Count the levels of the trie, one level at a time."""
+        height = 0
+        level = list(self.root.children.values())
+        while level:
+            height += 1
+            level = [child for node in level for child in node.children.values()]
+        return height
     
     def get_total_comparisons(self):
         """Get total number of comparisons made."""
@@ -180,31 +315,35 @@ class StringTrie:
         return self._cached_memory
 
     def _calculate_memory(self, node, visited=None):
-        """Recursively calculate memory usage of the trie with deep size calculation."""
+        """Calculate memory usage of the trie with deep size calculation (explicit stack)."""
         if visited is None:
             visited = set()
-            
-        if node is None or id(node) in visited:
-            return 0
         
-        visited.add(id(node))
+        memory = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is None or id(node) in visited:
+                continue
+            
+            visited.add(id(node))
 
-        # Size of the node object itself
-        memory = sys.getsizeof(node)
+            # Size of the node object itself and its edge substring
+            memory += sys.getsizeof(node)
+            memory += sys.getsizeof(node.edge_label)
 
-        # Size of the children dictionary
-        memory += sys.getsizeof(node.children)
+            # Size of the children dictionary
+            memory += sys.getsizeof(node.children)
 
-        # Size of the data_list
-        memory += sys.getsizeof(node.data_list)
+            # Size of the data_list
+            memory += sys.getsizeof(node.data_list)
 
-        # Deep size of each data item in the list
-        for data in node.data_list:
-            memory += _deep_getsizeof(data, visited)
+            # Deep size of each data item in the list
+            for data in node.data_list:
+                memory += _deep_getsizeof(data, visited)
 
-        # Recursively calculate memory for all children
-        for child in node.children.values():
-            memory += self._calculate_memory(child, visited)
+            # Children are added when popped
+            stack.extend(node.children.values())
 
         return memory
     
@@ -39,6 +39,8 @@ class TernarySearchTree:
         self.comparisons = 0
         self._cached_memory = None  # Cached memory calculation
         self._memory_dirty = True  # Flag to track if cache needs update
+        self._cached_height = None  # Cached height calculation
+        self._height_dirty = True  # Flag to track if height needs update
     
     def _normalize_string(self, s):
         """Normalize string for insertion (lowercase, strip)."""
@@ -61,6 +63,33 @@ class TernarySearchTree:
         self.root = self._insert_recursive(self.root, key, 0, data)
         self.size += 1
         self._memory_dirty = True  # Mark memory cache as dirty after insert
+        self._height_dirty = True
+
+    def bulk_insert(self, records):
+        """
+        Insert many records at once.
+        
+        Same result as calling insert() for every record; the root is kept
+        in a local and the size and cache flags are updated once at the end.
+        
+        Args:
+            records (iterable): (key_string, data) pairs
+        """
+        normalize = self._normalize_string
+        insert_recursive = self._insert_recursive
+        root = self.root
+        inserted = 0
+        for key_string, data in records:
+            key = normalize(key_string)
+            if key:
+                root = insert_recursive(root, key, 0, data)
+                inserted += 1
+        
+        self.root = root
+        if inserted:
+            self.size += inserted
+            self._memory_dirty = True
+            self._height_dirty = True
 
     def _insert_recursive(self, node, key, index, data):
         """Recursively insert into TST."""
@@ -269,19 +298,26 @@ class TernarySearchTree:
         return self.size
     
     def get_height(self):
-        """Get the height of the TST."""
-        return self._get_height_recursive(self.root)
+        """Get the height of the TST with caching (recounted after inserts)."""
+        if self._height_dirty or self._cached_height is None:
+            self._cached_height = self._calculate_height()
+            self._height_dirty = False
+        return self._cached_height
     
-    def _get_height_recursive(self, node):
-        """Recursively calculate TST height."""
-        if node is None:
-            return 0
-        
-        left_height = self._get_height_recursive(node.left)
-        middle_height = self._get_height_recursive(node.middle)
-        right_height = self._get_height_recursive(node.right)
-        
-        return 1 + max(left_height, middle_height, right_height)
+    def _calculate_height(self):
+        """Calculate TST height (deepest node, counting left/middle/right links) with a stack."""
+        height = 0
+        stack = [(self.root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if depth > height:
+                height = depth
+            stack.append((node.left, depth + 1))
+            stack.append((node.middle, depth + 1))
+            stack.append((node.right, depth + 1))
+        return height
     
     def get_total_comparisons(self):
         """Get total number of comparisons made."""
@@ -295,29 +331,33 @@ class TernarySearchTree:
         return self._cached_memory
 
     def _calculate_memory(self, node, visited=None):
-        """Recursively calculate memory usage of the TST with deep size calculation."""
+        """Calculate memory usage of the TST with deep size calculation (explicit stack)."""
         if visited is None:
             visited = set()
-            
-        if node is None or id(node) in visited:
-            return 0
         
-        visited.add(id(node))
+        memory = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is None or id(node) in visited:
+                continue
+            
+            visited.add(id(node))
 
-        # Size of the node object itself
-        memory = sys.getsizeof(node)
+            # Size of the node object itself
+            memory += sys.getsizeof(node)
 
-        # Size of the data_list
-        memory += sys.getsizeof(node.data_list)
+            # Size of the data_list
+            memory += sys.getsizeof(node.data_list)
 
-        # Deep size of each data item in the list
-        for data in node.data_list:
-            memory += _deep_getsizeof(data, visited)
+            # Deep size of each data item in the list
+            for data in node.data_list:
+                memory += _deep_getsizeof(data, visited)
 
-        # Recursively calculate memory for all three children
-        memory += self._calculate_memory(node.left, visited)
-        memory += self._calculate_memory(node.middle, visited)
-        memory += self._calculate_memory(node.right, visited)
+            # All three children are added when popped
+            stack.append(node.left)
+            stack.append(node.middle)
+            stack.append(node.right)
 
         return memory
     
@@ -4,10 +4,33 @@ Each level represents a digit of the rating (multiplied by 10 for precision).
 For example: rating 4.5 -> path 4 -> 5
 """
 
+from functools import lru_cache
+from operator import itemgetter
+
+from .ordered_tree import apply_field_filters, filter_records_by_field
+
+
+# Widest distance between a rating and its key's value (0.05 from rounding
+# to one decimal, plus margin for float error)
+_BUCKET_SLACK = 0.051
+
+
+@lru_cache(maxsize=1024)
+def _rating_key(rating):
+    """
+    Memoized rating -> digit string key (e.g. 4.5 -> "45", 10.0 -> "100").
+    
+    Ratings take few distinct values, so caching skips the format and
+    replace calls on almost every insert and lookup.
+    """
+    return f"{rating:.1f}".replace('.', '')
+
 
 class TrieNode:
     """Node in a Trie."""
     
+    __slots__ = ('children', 'data_list', 'is_end')
+    
     def __init__(self):
         """Initialize a Trie node."""
         self.children = {}  # digit -> TrieNode
@@ -25,6 +48,10 @@ class Trie:
         """Initialize an empty Trie."""
         self.root = TrieNode()
         self.size = 0
+        self._node_count = 1  # includes the root
+        self._height = 0  # longest key inserted so far
+        self._records_desc = None  # get_top_k cache, cleared on insert
+        self._lowercase_index = None  # filter_by_field 'contains' cache
     
     def _rating_to_key(self, rating):
         """
@@ -38,7 +65,7 @@ class Trie:
         """
         # Convert to string with 1 decimal place, remove decimal point
         # E.g., 4.5 -> "45", 3.0 -> "30", 10.0 -> "100"
-        return f"{rating:.1f}".replace('.', '')
+        return _rating_key(rating)
     
     def insert(self, rating, data):
         """
@@ -48,19 +75,62 @@ class Trie:
             rating (float): Overall rating (key)
             data (dict): Complete row data
         """
-        key = self._rating_to_key(rating)
+        key = _rating_key(rating)
         node = self.root
         
         # Traverse/create path for each digit
         for char in key:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+                self._node_count += 1
+            node = child
         
         # Store data at the leaf
         node.is_end = True
         node.data_list.append(data)
         self.size += 1
+        self._records_desc = None
+        self._lowercase_index = None
+        # Every node lies on some key's path, so height is the longest key
+        if len(key) > self._height:
+            self._height = len(key)
+    
+    def bulk_insert(self, records):
+        """
+        Insert many records at once.
+        
+        Records are grouped by key first, so each distinct rating is walked
+        down the trie once rather than once per record. Produces the same
+        trie (and the same record order per key) as calling insert() for
+        every record.
+        
+        Args:
+            records (iterable): (rating, data) pairs
+        """
+        grouped = {}
+        count = 0
+        for rating, data in records:
+            grouped.setdefault(_rating_key(rating), []).append(data)
+            count += 1
+        
+        for key, data_list in grouped.items():
+            node = self.root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = TrieNode()
+                    self._node_count += 1
+                node = child
+            node.is_end = True
+            node.data_list.extend(data_list)
+            if len(key) > self._height:
+                self._height = len(key)
+        
+        if count:
+            self.size += count
+            self._records_desc = None
+            self._lowercase_index = None
     
     def search(self, rating):
         """
@@ -72,14 +142,13 @@ class Trie:
         Returns:
             list: All records with the given rating
         """
-        key = self._rating_to_key(rating)
         node = self.root
         
         # Traverse the trie
-        for char in key:
-            if char not in node.children:
+        for char in _rating_key(rating):
+            node = node.children.get(char)
+            if node is None:
                 return []
-            node = node.children[char]
         
         if node.is_end:
             return node.data_list.copy()
@@ -96,14 +165,13 @@ class Trie:
         Returns:
             list: All records matching the prefix
         """
-        key = self._rating_to_key(rating_prefix)
         node = self.root
         
         # Traverse to the prefix node
-        for char in key:
-            if char not in node.children:
+        for char in _rating_key(rating_prefix):
+            node = node.children.get(char)
+            if node is None:
                 return []
-            node = node.children[char]
         
         # Collect all records under this prefix
         results = []
@@ -111,12 +179,40 @@ class Trie:
         return results
     
     def _collect_all_records(self, node, results):
-        """Recursively collect all records from a node downwards."""
-        if node.is_end:
-            results.extend(node.data_list)
+        """Collect all records from a node downwards (iterative preorder)."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.is_end:
+                results.extend(node.data_list)
+            
+            # Reversed so children are still visited in insertion order
+            stack.extend(reversed(node.children.values()))
+    
+    def iter_records(self, rating_prefix=None):
+        """
+        Lazily yield records in the same order as search_prefix/get_all_records.
+        
+        Only the walk stack is kept, and stopping early (break, islice)
+        skips the rest of the subtree. The list-building methods keep their
+        own loops, which are faster when every record is wanted.
+        
+        Args:
+            rating_prefix (float): Rating prefix to restrict to, None for all records
+        """
+        node = self.root
+        if rating_prefix is not None:
+            for char in _rating_key(rating_prefix):
+                node = node.children.get(char)
+                if node is None:
+                    return
         
-        for child in node.children.values():
-            self._collect_all_records(child, results)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.is_end:
+                yield from node.data_list
+            stack.extend(reversed(node.children.values()))
     
     def get_top_k(self, k):
         """
@@ -128,9 +224,15 @@ class Trie:
         Returns:
             list: Top K records sorted by rating (descending)
         """
-        all_records = self.get_all_records()
-        all_records.sort(key=lambda x: x['overall_rating'], reverse=True)
-        return all_records[:k]
+        if k <= 0:
+            return []
+        
+        # Sort once and reuse until the next insert; the sort is stable, so
+        # ties keep trie order (same result as heapq.nlargest)
+        if self._records_desc is None:
+            self._records_desc = sorted(self.get_all_records(),
+                                        key=itemgetter('overall_rating'), reverse=True)
+        return self._records_desc[:k]
     
     def get_range(self, min_rating, max_rating):
         """
@@ -143,9 +245,34 @@ class Trie:
         Returns:
             list: All records within the range
         """
-        all_records = self.get_all_records()
-        return [r for r in all_records 
-                if min_rating <= r['overall_rating'] <= max_rating]
+        results = []
+        stack = [(self.root, '')]
+        
+        # Same preorder as get_all_records, but each leaf's key tells which
+        # ratings its records can have (key / 10, +-0.05 from rounding), so
+        # whole buckets are skipped or taken without checking each record
+        while stack:
+            node, key = stack.pop()
+            if node.is_end:
+                try:
+                    center = int(key) / 10
+                except ValueError:
+                    center = None  # 'nan'/'inf' keys have no bucket bounds
+                
+                if center is None or not (
+                        center + _BUCKET_SLACK < min_rating
+                        or center - _BUCKET_SLACK > max_rating):
+                    if (center is not None
+                            and min_rating <= center - _BUCKET_SLACK
+                            and center + _BUCKET_SLACK <= max_rating):
+                        results.extend(node.data_list)
+                    else:
+                        results.extend([r for r in node.data_list
+                                        if min_rating <= r['overall_rating'] <= max_rating])
+            
+            stack.extend((child, key + char)
+                         for char, child in reversed(node.children.items()))
+        return results
     
     def get_all_records(self):
         """
@@ -162,20 +289,13 @@ class Trie:
         """Get the number of records in the trie."""
         return self.size
     
-    def _get_height(self):
-        """Calculate the maximum height of the trie."""
-        return self._get_height_recursive(self.root)
-    
-    def _get_height_recursive(self, node):
-        """Recursively calculate trie height."""
-        if not node.children:
-            return 0
-        return 1 + max(self._get_height_recursive(child) 
-                      for child in node.children.values())
+    def get_node_count(self):
+        """Get the number of trie nodes (including the root) in O(1)."""
+        return self._node_count
     
     def get_height(self):
-        """Get the height of the trie."""
-        return self._get_height_recursive(self.root)
+        """Get the height of the trie in O(1) (tracked during insert)."""
+        return self._height
     
     def filter_by_rating(self, min_rating=None, max_rating=None):
         """
@@ -188,7 +308,7 @@ class Trie:
         Returns:
             list: Filtered records
             
-        Time Complexity: O(n) - Trie must collect and filter all records
+        Time Complexity: O(k + m) - walks the k trie nodes, only boundary buckets are filtered
         Space Complexity: O(m) where m is number of results
         """
         if min_rating is None:
@@ -216,27 +336,29 @@ class Trie:
         Time Complexity: O(n) - must scan all nodes
         Space Complexity: O(m) where m is number of results
         """
-        all_records = self.get_all_records()
-        results = []
+        if condition == 'contains' and value:
+            records, lowered = self._get_lowercase_index(field_name)
+            needle = str(value).lower()
+            return [r for r, text in zip(records, lowered) if needle in text]
         
-        for record in all_records:
-            if field_name not in record:
-                continue
-            
-            field_value = record[field_name]
-            
-            if condition == 'equals' and field_value == value:
-                results.append(record)
-            elif condition == 'range' and min_value <= field_value <= max_value:
-                results.append(record)
-            elif condition == 'contains' and value and str(value).lower() in str(field_value).lower():
-                results.append(record)
-            elif condition == 'greater_than' and field_value > value:
-                results.append(record)
-            elif condition == 'less_than' and field_value < value:
-                results.append(record)
+        return filter_records_by_field(self.get_all_records(), field_name, value,
+                                       min_value, max_value, condition)
+    
+    def _get_lowercase_index(self, field_name):
+        """
+        Records that have field_name, with str(value).lower() for each.
         
-        return results
+        Built on the first 'contains' query for a field and kept until the
+        next insert, so repeated queries skip the per-record lowercasing.
+        """
+        if self._lowercase_index is None:
+            self._lowercase_index = {}
+        entry = self._lowercase_index.get(field_name)
+        if entry is None:
+            records = [r for r in self.get_all_records() if field_name in r]
+            entry = (records, [str(r[field_name]).lower() for r in records])
+            self._lowercase_index[field_name] = entry
+        return entry
     
     def filter_multi_criteria(self, filters):
         """
@@ -265,18 +387,8 @@ class Trie:
             # Get all records
             results = self.get_all_records()
         
-        # Apply additional filters sequentially
-        for field, criteria in filters.items():
-            if field == 'rating':
-                continue  # Already applied
-            
-            if 'value' in criteria:
-                results = [r for r in results if r.get(field) == criteria['value']]
-            elif 'min' in criteria and 'max' in criteria:
-                results = [r for r in results 
-                          if criteria['min'] <= r.get(field, float('-inf')) <= criteria['max']]
-        
-        return results
+        # Apply the remaining filters in one fused pass
+        return apply_field_filters(results, filters)
     
     def __str__(self):
         """String representation of the Trie."""
@@ -6,7 +6,8 @@ Each row is stored with overall_rating as the key.
 import sys
 from pathlib import Path
 import time
-import random
+
+import numpy as np
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
@@ -59,26 +60,29 @@ def load_lounge_data_into_trees():
     print("\n Inserting records into trees...")
     print("-" * 80)
     
-    # Convert dataframe to list of tuples
-    records = [(row['overall_rating'], row.to_dict()) for _, row in lounge_df.iterrows()]
+    # Convert dataframe to list of (rating, record) tuples in one pass
+    records = [(data['overall_rating'], data) for data in lounge_df.to_dict(orient='records')]
     
     for tree_name, tree in trees.items():
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         
-        # Create a copy and shuffle ONLY for BST to prevent unbalanced tree
-        if tree_name == 'BST':
-            tree_records = records.copy()
-            random.shuffle(tree_records)
+        if hasattr(tree, 'bulk_insert'):
+            tree.bulk_insert(records)
+        elif tree_name == 'BST':
+            # Insert in shuffled order ONLY for BST to prevent unbalanced tree;
+            # shuffling an index array leaves the shared records list untouched
+            order = np.random.default_rng().permutation(len(records))
+            for i in order.tolist():
+                rating, data = records[i]
+                tree.insert(rating, data)
         else:
-            tree_records = records
-        
-        for rating, data in tree_records:
-            tree.insert(rating, data)
+            for rating, data in records:
+                tree.insert(rating, data)
         
-        elapsed = time.time() - start_time
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
         
         print(f"{tree_name:12} | Size: {tree.get_size():,} | Height: {tree.get_height():3} | "
-              f"Time: {elapsed:.3f}s")
+              f"Time: {elapsed_ms:.1f}ms")
     
     print("-" * 80)
     print(f" All {len(lounge_df):,} records inserted into all trees")
@@ -98,17 +102,25 @@ def demonstrate_tree_operations(trees, df):
     print("DEMONSTRATING TREE OPERATIONS")
     print("=" * 80)
     
+    # Column array for the NumPy baseline lines, computed without any tree
+    ratings = df['overall_rating'].to_numpy(dtype=np.float64)
+    
     # Demo 1: Search for specific rating
     print("\n[1] SEARCH: Find all records with rating 5.0")
     print("-" * 80)
     target_rating = 5.0
     
     for tree_name, tree in trees.items():
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         results = tree.search(target_rating)
-        elapsed = time.time() - start_time
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
         
-        print(f"{tree_name:12} | Found: {len(results):4} records | Time: {elapsed:.6f}s")
+        print(f"{tree_name:12} | Found: {len(results):4} records | Time: {elapsed_ms:.3f}ms")
+    
+    t0 = time.perf_counter_ns()
+    found = np.count_nonzero(ratings == target_rating)
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+    print(f"{'NumPy':12} | Found: {found:4} records | Time: {elapsed_ms:.3f}ms")
     
     # Demo 2: Get top K highest rated
     print("\n[2] TOP-K: Get top 10 highest rated lounges")
@@ -116,14 +128,21 @@ def demonstrate_tree_operations(trees, df):
     k = 10
     
     for tree_name, tree in trees.items():
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         top_k = tree.get_top_k(k)
-        elapsed = time.time() - start_time
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
         
         if len(top_k) > 0:
             avg_rating = sum(r['overall_rating'] for r in top_k) / len(top_k)
             print(f"{tree_name:12} | Retrieved: {len(top_k):2} | Avg Rating: {avg_rating:.2f} | "
-                  f"Time: {elapsed:.6f}s")
+                  f"Time: {elapsed_ms:.3f}ms")
+    
+    t0 = time.perf_counter_ns()
+    top_vals = np.sort(ratings)[::-1][:k]
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+    if len(top_vals) > 0:
+        print(f"{'NumPy':12} | Retrieved: {len(top_vals):2} | Avg Rating: {top_vals.mean():.2f} | "
+              f"Time: {elapsed_ms:.3f}ms")
     
     # Show top 3 results
     print("\n   Top 3 lounges:")
@@ -137,11 +156,16 @@ def demonstrate_tree_operations(trees, df):
     min_rating, max_rating = 4.0, 5.0
     
     for tree_name, tree in trees.items():
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         results = tree.get_range(min_rating, max_rating)
-        elapsed = time.time() - start_time
+        elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
         
-        print(f"{tree_name:12} | Found: {len(results):5} records | Time: {elapsed:.6f}s")
+        print(f"{tree_name:12} | Found: {len(results):5} records | Time: {elapsed_ms:.3f}ms")
+    
+    t0 = time.perf_counter_ns()
+    found = np.count_nonzero((ratings >= min_rating) & (ratings <= max_rating))
+    elapsed_ms = (time.perf_counter_ns() - t0) / 1e6
+    print(f"{'NumPy':12} | Found: {found:5} records | Time: {elapsed_ms:.3f}ms")
 
 
 def main():
@@ -153,18 +177,9 @@ def main():
         # Demonstrate operations
         demonstrate_tree_operations(trees, df)
         
-        # Try to save trees to disk (skip BST if too deep)
+        # Try to save trees to disk
         try:
-            trees_to_save = {}
-            for name, tree in trees.items():
-                # Skip BST if height is too large for pickle
-                if name == 'BST' and tree.get_height() > 1000:
-                    print(f"\n  Skipping {name} save (height {tree.get_height()} too large for pickle)")
-                else:
-                    trees_to_save[name] = tree
-            
-            if trees_to_save:
-                save_trees(trees_to_save, 'lounge')
+            save_trees(trees, 'lounge')
         except Exception as save_error:
             print(f"\n  Warning: Could not save trees to disk: {save_error}")
             print("   Trees are still available in memory for current session.")
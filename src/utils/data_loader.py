@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 
 def load_data_from_csv(file_path):
@@ -13,13 +13,93 @@ def load_data_from_csv(file_path):
         return None
 
 
-def load_cleaned_data(dataset_name: Optional[str] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+def _widen_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give Parquet-loaded columns the same dtypes and values pd.read_csv would
+    produce.
+    
+    float32 columns (Parquet copies written from a downcast frame) go through
+    their shortest decimal text, like the CSV did, so 4.3 comes back as 4.3
+    rather than 4.300000190734863.
+    """
+    widened = {}
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            widened[col] = dtype.categories.dtype
+        elif dtype == 'float32':
+            df = df.assign(**{col: df[col].astype(str).astype('float64')})
+        elif pd.api.types.is_float_dtype(dtype):
+            widened[col] = 'float64'
+        elif pd.api.types.is_integer_dtype(dtype):
+            widened[col] = 'int64'
+    return df.astype(widened) if widened else df
+
+
+def downcast_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a DataFrame's memory footprint by narrowing its dtypes.
+    
+    Integer and float columns are downcast to the smallest type that holds
+    their values, and low-cardinality string columns (<50% unique values)
+    become categoricals. Shared by EDA/clean_data.py (before writing the
+    cleaned files) and load_cleaned_data(downcast=True).
+    """
+    df = df.copy()
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes('float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    if len(df) > 0:
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            if df[col].nunique() / len(df) < 0.5:
+                df[col] = df[col].astype('category')
+    return df
+
+
+def _read_cleaned_file(csv_path: Path, columns: Optional[List[str]] = None,
+                       downcast: bool = False) -> pd.DataFrame:
+    """
+    Read a cleaned dataset, preferring the Parquet copy written next to the CSV.
+    
+    The Parquet file is only used if it is at least as new as the CSV and
+    pyarrow is installed; otherwise the CSV is parsed, and a full parse is
+    written back as the Parquet copy so the next load can use it. columns
+    limits the read to those columns (projection is pushed down to the
+    Parquet reader). With downcast=True the narrow dtypes are kept/applied
+    instead of the default read_csv dtypes.
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+            return downcast_dtypes(df) if downcast else _widen_dtypes(df)
+        except (ImportError, ValueError, TypeError):
+            pass  # No pyarrow or unreadable Parquet copy: parse the CSV
+    df = pd.read_csv(csv_path, usecols=columns)
+    if columns is None:
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='snappy')
+        except (ImportError, ValueError, TypeError, OSError):
+            # No pyarrow, unsupported column data or read-only data dir:
+            # keep parsing the CSV
+            pass
+    return downcast_dtypes(df) if downcast else df
+
+
+def load_cleaned_data(dataset_name: Optional[str] = None,
+                      columns: Optional[List[str]] = None,
+                      downcast: bool = False) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """
     Load cleaned datasets from the cleaned_data directory.
     
     Args:
         dataset_name: Name of a specific dataset to load (e.g., 'airline', 'airport', 'lounge', 'seat')
                      If None, loads all cleaned datasets.
+        columns: Only load these columns (default: all columns)
+        downcast: Narrow dtypes (float32, small ints, categoricals) to halve
+                  memory. Off by default: float32 ratings are not exactly
+                  equal to their float64 values, which breaks exact-match
+                  searches on trees built from the data.
     
     Returns:
         If dataset_name is provided: A single DataFrame
@@ -33,6 +113,9 @@ def load_cleaned_data(dataset_name: Optional[str] = None) -> Union[pd.DataFrame,
         all_data = load_cleaned_data()
         airline_df = all_data['airline']
         airport_df = all_data['airport']
+        
+        # Load only the columns you need
+        ratings_df = load_cleaned_data('airline', columns=['airline_name', 'overall_rating'])
     """
     # Get the path to the cleaned data directory
     current_dir = Path(__file__).parent
@@ -54,7 +137,7 @@ def load_cleaned_data(dataset_name: Optional[str] = None) -> Union[pd.DataFrame,
             )
         
         print(f"Loading cleaned dataset: {dataset_name}")
-        df = pd.read_csv(file_path)
+        df = _read_cleaned_file(file_path, columns, downcast)
         print(f"Loaded {dataset_name}: {df.shape[0]:,} rows × {df.shape[1]} columns")
         return df
     
@@ -73,7 +156,7 @@ def load_cleaned_data(dataset_name: Optional[str] = None) -> Union[pd.DataFrame,
     
     for file_path in cleaned_files:
         dataset_name = file_path.stem.replace('_cleaned', '')
-        df = pd.read_csv(file_path)
+        df = _read_cleaned_file(file_path, columns, downcast)
         dataframes[dataset_name] = df
         print(f"Loaded {dataset_name}: {df.shape[0]:,} rows × {df.shape[1]} columns")
     
@@ -7,10 +7,11 @@ of filtering operations across different data structures.
 
 import time
 import sys
-import statistics
 import tracemalloc
 from typing import Dict, List, Callable, Any, Optional
 
+import numpy as np
+
 
 class FilterBenchmark:
     """Benchmark filtering operations on tree data structures."""
@@ -42,21 +43,22 @@ class FilterBenchmark:
         Returns:
             Dict with timing statistics (avg, min, max, std_dev) in milliseconds
         """
-        times = []
+        times = np.empty(num_runs, dtype=np.float64)
         results_size = 0
         
-        for _ in range(num_runs):
+        for i in range(num_runs):
             start = time.perf_counter()
             result = operation(*args, **kwargs)
-            elapsed = time.perf_counter() - start
-            times.append(elapsed * 1000)  # Convert to milliseconds
+            times[i] = time.perf_counter() - start
             results_size = len(result) if hasattr(result, '__len__') else 0
         
+        times *= 1000  # Convert to milliseconds
+        
         return {
-            'avg_time_ms': sum(times) / len(times),
-            'min_time_ms': min(times),
-            'max_time_ms': max(times),
-            'std_dev_ms': statistics.stdev(times) if len(times) > 1 else 0,
+            'avg_time_ms': float(times.mean()),
+            'min_time_ms': float(times.min()),
+            'max_time_ms': float(times.max()),
+            'std_dev_ms': float(times.std(ddof=1)) if num_runs > 1 else 0,
             'num_runs': num_runs,
             'results_count': results_size
         }
@@ -30,17 +30,22 @@ class PerformanceTracker:
         return self.comparisons
     
     @contextmanager
-    def track_operation(self, operation_name: str):
-        """Context manager to track an operation."""
-        start_time = time.perf_counter()
-        start_memory = sys.getsizeof(self)
+    def track_operation(self, operation_name: str, target: Any = None):
+        """
+        Context manager to track an operation.
+        
+        Memory is only measured when a target object is passed; its shallow
+        size is taken before and after the operation.
+        """
+        start_memory = sys.getsizeof(target) if target is not None else 0
         initial_comparisons = self.comparisons
+        start_time = time.perf_counter_ns()
         
         try:
             yield self
         finally:
-            elapsed = (time.perf_counter() - start_time) * 1000  # milliseconds
-            end_memory = sys.getsizeof(self)
+            elapsed = (time.perf_counter_ns() - start_time) / 1e6  # milliseconds
+            end_memory = sys.getsizeof(target) if target is not None else 0
             memory_delta = end_memory - start_memory
             comparisons_delta = self.comparisons - initial_comparisons
             
@@ -83,36 +88,43 @@ def get_memory_usage(obj):
 
 
 def estimate_memory_usage_tree(node, visited=None):
-    """Estimate memory usage of a tree structure."""
+    """
+    Estimate memory usage of a tree structure.
+    
+    Walks the nodes with an explicit stack, so degenerate (very deep) trees
+    do not hit the recursion limit.
+    """
     if visited is None:
         visited = set()
     
-    if node is None or id(node) in visited:
-        return 0
-    
-    visited.add(id(node))
-    memory = sys.getsizeof(node)
-    
-    # Add children
-    if hasattr(node, 'left'):
-        memory += estimate_memory_usage_tree(node.left, visited)
-    if hasattr(node, 'right'):
-        memory += estimate_memory_usage_tree(node.right, visited)
-    if hasattr(node, 'children'):
-        if isinstance(node.children, dict):
-            for child in node.children.values():
-                memory += estimate_memory_usage_tree(child, visited)
-        elif isinstance(node.children, list):
-            for child in node.children:
-                memory += estimate_memory_usage_tree(child, visited)
-    
-    # Add data - use deep size for dictionaries to account for all keys/values
-    if hasattr(node, 'data'):
-        memory += _deep_getsizeof(node.data, visited)
-    if hasattr(node, 'data_list'):
-        memory += sys.getsizeof(node.data_list)
-        for item in node.data_list:
-            memory += _deep_getsizeof(item, visited)
+    memory = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None or id(node) in visited:
+            continue
+        
+        visited.add(id(node))
+        memory += sys.getsizeof(node)
+        
+        # Queue children
+        if hasattr(node, 'left'):
+            stack.append(node.left)
+        if hasattr(node, 'right'):
+            stack.append(node.right)
+        if hasattr(node, 'children'):
+            if isinstance(node.children, dict):
+                stack.extend(node.children.values())
+            elif isinstance(node.children, list):
+                stack.extend(node.children)
+        
+        # Add data - use deep size for dictionaries to account for all keys/values
+        if hasattr(node, 'data'):
+            memory += _deep_getsizeof(node.data, visited)
+        if hasattr(node, 'data_list'):
+            memory += sys.getsizeof(node.data_list)
+            for item in node.data_list:
+                memory += _deep_getsizeof(item, visited)
     
     return memory
 
@@ -3,14 +3,12 @@ Utility to save and load tree structures to/from disk using pickle.
 This allows you to build trees once and reuse them without rebuilding.
 """
 
+import functools
+import mmap
 import pickle
-import sys
 from pathlib import Path
 import time
 
-# Increase recursion limit for pickling large trees
-sys.setrecursionlimit(100000)
-
 
 def save_trees(trees, dataset_name, output_dir='data/trees'):
     """
@@ -43,20 +41,11 @@ def save_trees(trees, dataset_name, output_dir='data/trees'):
             filename = f"{dataset_name}_{tree_name.lower().replace('-', '_')}_tree.pkl"
         filepath = output_path / filename
         
-        # Save using pickle with highest protocol and recursion limit handling
+        # Save using pickle with highest protocol
         start_time = time.time()
         try:
             with open(filepath, 'wb') as f:
                 pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
-        except RecursionError:
-            # If still hitting recursion, increase limit temporarily
-            old_limit = sys.getrecursionlimit()
-            sys.setrecursionlimit(200000)
-            try:
-                with open(filepath, 'wb') as f:
-                    pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
-            finally:
-                sys.setrecursionlimit(old_limit)
         except Exception as e:
             print(f"ERROR: Failed to save {tree_name}: {e}")
             continue  # Skip this tree and continue with others
@@ -89,6 +78,9 @@ def save_trees(trees, dataset_name, output_dir='data/trees'):
     print("-" * 80)
     print(f"All trees saved to: {output_path.absolute()}")
     
+    # Trees on disk changed, so previously loaded copies are stale
+    load_trees.cache_clear()
+    
     return saved_paths
 
 
@@ -96,6 +88,17 @@ def load_trees(dataset_name, tree_types=None, input_dir='data/trees'):
     """
     Load tree structures from disk.
     
+    Results are cached in-process (keyed by the resolved input_dir and the
+    modification times of the dataset's tree files), so loading the same
+    trees again returns the already unpickled objects instead of reading the
+    files a second time, while files rewritten by another process are picked
+    up. Call load_trees.cache_clear() to force a reload.
+    
+    The returned dict is a fresh copy, but the trees in it are shared, live
+    objects: every caller gets the same instances (possibly from several
+    threads). Do not mutate them (insert, or set attributes on them); work
+    on a copy instead.
+    
     Args:
         dataset_name (str): Name of the dataset (e.g., 'airline', 'airport')
         tree_types (list): List of tree types to load (e.g., ['BST', 'AVL'])
@@ -105,6 +108,21 @@ def load_trees(dataset_name, tree_types=None, input_dir='data/trees'):
     Returns:
         dict: Dictionary of loaded tree structures
     """
+    if tree_types is not None:
+        tree_types = tuple(tree_types)
+    input_path = Path(input_dir).resolve()
+    # A rewritten file changes the key, so the stale entry is simply not hit
+    mtimes = tuple(sorted(
+        (filepath.name, filepath.stat().st_mtime_ns)
+        for filepath in input_path.glob(f"{dataset_name}_*_tree.pkl")
+    ))
+    # Copy the dict so callers can add/remove entries without touching the cache
+    return dict(_load_trees_cached(dataset_name, tree_types, str(input_path), mtimes))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_trees_cached(dataset_name, tree_types, input_dir, mtimes=()):
+    """Unpickle the requested trees; memoised by load_trees() (mtimes is only part of the key)."""
     input_path = Path(input_dir)
     
     if not input_path.exists():
@@ -161,10 +179,12 @@ def load_trees(dataset_name, tree_types=None, input_dir='data/trees'):
             print(f"WARNING: {tree_type:20} | File not found: {filename}")
             continue
         
-        # Load using pickle
+        # Load using pickle, unpickling straight from a read-only memory map
+        # of the file rather than through buffered file reads
         start_time = time.time()
         with open(filepath, 'rb') as f:
-            tree = pickle.load(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tree = pickle.loads(mm)
         elapsed = time.time() - start_time
         
         # Get file size
@@ -196,6 +216,9 @@ def load_trees(dataset_name, tree_types=None, input_dir='data/trees'):
     return trees
 
 
+load_trees.cache_clear = _load_trees_cached.cache_clear
+
+
 def list_saved_trees(input_dir='data/trees'):
     """
     List all saved trees in the directory.
@@ -0,0 +1,120 @@
+# test_build_from_sorted.py
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_structures.binary_search_tree import BinarySearchTree
+from data_structures.avl_tree import AVLTree
+from data_structures.red_black_tree import RedBlackTree, Color
+
+TREE_CLASSES = [BinarySearchTree, AVLTree, RedBlackTree]
+
+
+def make_records(n, seed):
+    """Random (rating, record) pairs on a 0.5 grid, so ratings repeat a lot."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        rating = rng.randint(0, 20) / 2
+        records.append((rating, {'id': i, 'overall_rating': rating}))
+    return records
+
+
+def ids(records):
+    return [record['id'] for record in records]
+
+
+def tree_walk_answers(tree, queries):
+    """Answer queries with the sidecar switched off, so the nodes are walked."""
+    sorted_ratings, sorted_data = tree._sorted_ratings, tree._sorted_data
+    tree._sorted_ratings = tree._sorted_data = None
+    try:
+        return queries(tree)
+    finally:
+        tree._sorted_ratings, tree._sorted_data = sorted_ratings, sorted_data
+
+
+def run_queries(tree):
+    return {
+        'search': [sorted(ids(tree.search(r / 2))) for r in range(-1, 22)],
+        'range': [ids(tree.get_range(a / 2, b / 2)) for a in range(-1, 22, 3) for b in range(-1, 22, 4)],
+        'top_k': [ids(tree.get_top_k(k)) for k in (0, 1, 5, 50, 10000)],
+    }
+
+
+class TestBuildFromSorted(unittest.TestCase):
+
+    def black_height(self, tree, node):
+        """Black height of node's subtree; fails on a red-red edge or uneven paths."""
+        if node is tree.NIL:
+            return 1
+        left = self.black_height(tree, node.left)
+        right = self.black_height(tree, node.right)
+        self.assertEqual(left, right)
+        if node.color == Color.RED:
+            self.assertEqual(node.left.color, Color.BLACK)
+            self.assertEqual(node.right.color, Color.BLACK)
+        return left + (1 if node.color == Color.BLACK else 0)
+
+    def test_red_black_coloring(self):
+        sizes = [1, 2, 3, 5, 6, 7, 100, 1000] + [2 ** k for k in range(2, 11)]
+        for n in sizes:
+            with self.subTest(n=n):
+                tree = RedBlackTree()
+                tree.build_from_sorted(make_records(n, n))
+                self.assertEqual(tree.root.color, Color.BLACK)
+                self.assertIs(tree.root.parent, tree.NIL)
+                self.black_height(tree, tree.root)
+
+                # A following insert must keep the Red-Black properties
+                tree.insert(5.0, {'id': -1, 'overall_rating': 5.0})
+                self.assertEqual(tree.root.color, Color.BLACK)
+                self.black_height(tree, tree.root)
+
+    def test_empty_records(self):
+        for tree_class in TREE_CLASSES:
+            tree = tree_class()
+            tree.build_from_sorted([])
+            self.assertEqual(tree.get_size(), 0)
+            self.assertEqual(tree.search(1.0), [])
+            self.assertEqual(tree.get_range(0.0, 10.0), [])
+            self.assertEqual(tree.get_top_k(3), [])
+
+    def test_sidecar_matches_tree_walk(self):
+        for tree_class in TREE_CLASSES:
+            for n in (1, 2, 3, 64, 777):
+                with self.subTest(tree=tree_class.__name__, n=n):
+                    records = make_records(n, n)
+                    tree = tree_class()
+                    tree.build_from_sorted(records)
+                    self.assertEqual(tree.get_size(), n)
+                    self.assertIsNotNone(tree._sorted_ratings)
+
+                    inorder = []
+                    tree._inorder_traversal(tree.root, inorder)
+                    expected = sorted(records, key=lambda pair: pair[0])
+                    self.assertEqual(ids(inorder), ids(data for _, data in expected))
+
+                    self.assertEqual(run_queries(tree), tree_walk_answers(tree, run_queries))
+
+    def test_insert_drops_sidecar(self):
+        for tree_class in TREE_CLASSES:
+            with self.subTest(tree=tree_class.__name__):
+                tree = tree_class()
+                tree.build_from_sorted(make_records(200, 9))
+                new_record = {'id': 200, 'overall_rating': 4.5}
+                tree.insert(4.5, new_record)
+
+                self.assertIsNone(tree._sorted_ratings)
+                self.assertIsNone(tree._sorted_data)
+                self.assertEqual(tree.get_size(), 201)
+                self.assertIn(200, ids(tree.search(4.5)))
+                self.assertIn(200, ids(tree.get_range(4.0, 5.0)))
+                self.assertEqual(len(tree.get_range(-1.0, 11.0)), 201)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# test_clean_data.py
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'EDA'))
+
+import clean_data
+
+
+def write_csv(directory, name, df):
+    path = Path(directory) / f"{name}.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def mixed_frame(n=40):
+    """A bool-with-NaN column (object dtype after read_csv), a mixed column and a string column."""
+    return pd.DataFrame({
+        'overall_rating': [i % 10 / 2 for i in range(n)],
+        'recommended': [True, False, None, True][:4] * (n // 4),
+        'mixed': [1, 'two', 3.5, None] * (n // 4),
+        'airline_name': [f"airline {i % 7}" for i in range(n)],
+    })
+
+
+class TestEstimateMemory(unittest.TestCase):
+
+    def test_string_columns_add_their_length(self):
+        df = pd.DataFrame({'name': ['a', 'bb', None, 'dddd'], 'x': [1, 2, 3, 4]})
+        expected = df.memory_usage(deep=False).sum() + 7
+        self.assertEqual(clean_data.estimate_memory(df), expected)
+
+    def test_non_string_object_columns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            df = pd.read_csv(write_csv(tmp, 'mixed', mixed_frame()))
+        self.assertEqual(df['recommended'].dtype, object)
+
+        memory = clean_data.estimate_memory(df)
+        self.assertIsInstance(memory, int)
+        self.assertGreater(memory, df.memory_usage(deep=False).sum())
+
+    def test_datasets_with_bool_nan_column_are_cleaned(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_file = write_csv(tmp, 'mixed', mixed_frame())
+            cleaned_dir = Path(tmp) / 'cleaned'
+            cleaned_dir.mkdir()
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                name, summary = clean_data._process_one(csv_file, cleaned_dir)
+                chunked = clean_data.clean_csv_chunked(
+                    csv_file, cleaned_dir / 'chunked.csv', 'mixed', 7)
+
+            self.assertEqual(name, 'mixed')
+            self.assertIsNotNone(summary)
+            self.assertTrue((cleaned_dir / 'mixed_cleaned.csv').exists())
+            self.assertIsNotNone(chunked)
+            self.assertEqual(chunked['shape'][0], summary['shape'][0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# test_data_loader.py
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'EDA'))
+
+import clean_data
+from utils.data_loader import _read_cleaned_file, _widen_dtypes
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def ratings_frame():
+    return pd.DataFrame({
+        'airline_name': ['a', 'b', 'a', 'c', 'b', 'a'] * 5,
+        'overall_rating': [4.3, 0.1, 7.7, 9.9, 3.6, 5.0] * 5,
+        'seat_comfort': [1, 2, 3, 4, 5, 3] * 5,
+    })
+
+
+def clean_to(tmp, df):
+    """Run the cleaning step on df and return the cleaned CSV path."""
+    csv_file = Path(tmp) / 'ratings.csv'
+    df.to_csv(csv_file, index=False)
+    cleaned_dir = Path(tmp) / 'cleaned'
+    cleaned_dir.mkdir()
+    with contextlib.redirect_stdout(io.StringIO()):
+        name, summary = clean_data._process_one(csv_file, cleaned_dir)
+    assert summary is not None
+    return cleaned_dir / 'ratings_cleaned.csv'
+
+
+class TestCleanedParquetCopy(unittest.TestCase):
+
+    def test_widened_float32_matches_csv_values(self):
+        narrow = clean_data.downcast_dtypes(ratings_frame())
+        self.assertEqual(narrow['overall_rating'].dtype, 'float32')
+
+        buffer = io.StringIO()
+        narrow.to_csv(buffer, index=False)
+        buffer.seek(0)
+        from_csv = pd.read_csv(buffer)
+
+        pd.testing.assert_frame_equal(_widen_dtypes(narrow), from_csv, check_exact=True)
+
+    def test_parquet_copy_is_written_full_width(self):
+        written = {}
+
+        def capture(df, path, *args, **kwargs):
+            written['df'] = df.copy()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(clean_data, 'HAS_PYARROW', True), \
+                    mock.patch.object(pd.DataFrame, 'to_parquet', capture):
+                csv_file = clean_to(tmp, ratings_frame())
+            from_csv = pd.read_csv(csv_file)
+
+        self.assertEqual(written['df']['overall_rating'].dtype, 'float64')
+        pd.testing.assert_frame_equal(_widen_dtypes(written['df']).reset_index(drop=True),
+                                      from_csv, check_exact=True)
+
+    @unittest.skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+    def test_parquet_and_csv_reads_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_file = clean_to(tmp, ratings_frame())
+            self.assertTrue(csv_file.with_suffix('.parquet').exists())
+            pd.testing.assert_frame_equal(_read_cleaned_file(csv_file), pd.read_csv(csv_file),
+                                          check_exact=True)
+
+if __name__ == '__main__':
+    unittest.main()
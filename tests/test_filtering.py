@@ -3,6 +3,7 @@ Simple benchmark runner without Unicode issues
 """
 import sys
 import os
+import csv
 import pickle
 from pathlib import Path
 import time
@@ -15,7 +16,6 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from utils.filter_benchmarks import FilterBenchmark
-import pandas as pd
 
 print("=" * 70)
 print("FILTERING BENCHMARK - SIMPLIFIED")
@@ -99,25 +99,32 @@ print("\n3. Saving results...")
 output_dir = Path("results/filtering/airline")
 output_dir.mkdir(exist_ok=True, parents=True)
 
-df = pd.DataFrame(results)
+# A handful of rows - csv.DictWriter is plenty, no need to import pandas
+fieldnames = ['tree', 'selectivity_level', 'min_rating', 'max_rating',
+              'avg_time_ms', 'memory_kb', 'results', 'selectivity_pct']
 csv_file = output_dir / "benchmark_results.csv"
-df.to_csv(csv_file, index=False)
+with open(csv_file, 'w', newline='') as f:
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(results)
 print(f"   [OK] Saved to {csv_file}")
 
 # Print summary
 print("\n4. Performance Summary")
 print("=" * 70)
 
-for level in df['selectivity_level'].unique():
-    level_df = df[df['selectivity_level'] == level]
+levels = list(dict.fromkeys(row['selectivity_level'] for row in results))
+
+for level in levels:
     print(f"\n{level}:")
-    level_df_sorted = level_df.sort_values('avg_time_ms')
+    level_sorted = sorted((row for row in results if row['selectivity_level'] == level),
+                          key=lambda row: row['avg_time_ms'])
     
-    for _, row in level_df_sorted.iterrows():
+    for row in level_sorted:
         print(f"   {row['tree']:12} - {row['avg_time_ms']:6.2f}ms")
     
-    fastest = level_df_sorted.iloc[0]
-    slowest = level_df_sorted.iloc[-1]
+    fastest = level_sorted[0]
+    slowest = level_sorted[-1]
     speedup = slowest['avg_time_ms'] / fastest['avg_time_ms']
     print(f"   Speedup: {fastest['tree']} is {speedup:.1f}x faster than {slowest['tree']}")
 
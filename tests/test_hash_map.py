@@ -0,0 +1,63 @@
+# test_hash_map.py
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_structures.hash_map import HashMap
+
+
+def make_records(n, seed, start=0):
+    """Random (rating, record) pairs on a 0.25 grid, with a few missing ratings."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(start, start + n):
+        rating = None if rng.random() < 0.05 else rng.randint(0, 80) / 4
+        records.append((rating, {'id': i, 'overall_rating': rating}))
+    return records
+
+
+def contents(hash_map):
+    return {rating: [record['id'] for record in data_list]
+            for bucket in hash_map.buckets for rating, data_list in bucket}
+
+
+class TestBulkInsert(unittest.TestCase):
+
+    def test_bulk_matches_per_record_insert(self):
+        for seed in range(300):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                existing = make_records(rng.randint(0, 60), seed)
+                batch = make_records(rng.randint(0, 150), seed + 1000, start=len(existing))
+
+                one_by_one = HashMap()
+                bulk = HashMap()
+                for rating, data in existing:
+                    one_by_one.insert(rating, data)
+                    bulk.insert(rating, data)
+                for rating, data in batch:
+                    one_by_one.insert(rating, data)
+                bulk.bulk_insert(batch)
+
+                self.assertEqual(bulk.capacity, one_by_one.capacity)
+                self.assertEqual(bulk.size, one_by_one.size)
+                self.assertEqual(bulk._record_count, one_by_one._record_count)
+                self.assertEqual(contents(bulk), contents(one_by_one))
+
+    def test_repeated_ratings_do_not_grow_the_table(self):
+        # 11 ratings in 16 buckets is just under the 0.75 load factor
+        ratings = [i / 2 for i in range(11)]
+        hash_map = HashMap(initial_capacity=16)
+        hash_map.bulk_insert([(rating, {'id': i}) for i, rating in enumerate(ratings)])
+        self.assertEqual(hash_map.capacity, 16)
+
+        hash_map.bulk_insert([(rating, {'id': -1}) for rating in ratings])
+        self.assertEqual(hash_map.capacity, 16)
+        self.assertEqual(hash_map.size, 11)
+
+if __name__ == '__main__':
+    unittest.main()
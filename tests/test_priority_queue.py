@@ -1,19 +1,26 @@
+import heapq
+import itertools
+
+
 class PriorityQueue:
+    # Binary min-heap of (priority, insertion order, item): put/get are
+    # O(log n). The insertion counter breaks ties FIFO, so items themselves
+    # never need to be comparable.
     def __init__(self):
         self.elements = []
+        self._counter = itertools.count()
 
     def is_empty(self):
         return not self.elements
 
     def put(self, item, priority):
-        self.elements.append((priority, item))
-        self.elements.sort(reverse=True)
+        heapq.heappush(self.elements, (priority, next(self._counter), item))
 
     def get(self):
-        return self.elements.pop()[1] if not self.is_empty() else None
+        return heapq.heappop(self.elements)[2] if not self.is_empty() else None
 
     def peek(self):
-        return self.elements[-1][1] if not self.is_empty() else None
+        return self.elements[0][2] if not self.is_empty() else None
 
     def size(self):
         return len(self.elements)
\ No newline at end of file
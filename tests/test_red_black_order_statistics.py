@@ -0,0 +1,91 @@
+# test_red_black_order_statistics.py
+
+import bisect
+import pickle
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_structures.red_black_tree import RedBlackTree
+
+
+def make_records(n, seed):
+    """Random (rating, record) pairs on a 0.5 grid, so ratings repeat a lot."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        rating = rng.randint(0, 20) / 2
+        records.append((rating, {'id': i, 'overall_rating': rating}))
+    return records
+
+
+class TestRedBlackOrderStatistics(unittest.TestCase):
+
+    def build_trees(self, records):
+        inserted = RedBlackTree()
+        for rating, data in records:
+            inserted.insert(rating, data)
+
+        built = RedBlackTree()
+        built.build_from_sorted(records)
+
+        unpickled = pickle.loads(pickle.dumps(inserted))
+        return {'insert': inserted, 'build_from_sorted': built, 'pickled': unpickled}
+
+    def assert_counts(self, tree):
+        nil = tree.NIL
+        self.assertEqual(nil.count, 0)
+        self.assertEqual(tree.root.count, tree.size)
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if node is nil:
+                continue
+            self.assertEqual(node.count, 1 + node.left.count + node.right.count)
+            stack.append(node.left)
+            stack.append(node.right)
+
+    def assert_queries(self, tree):
+        inorder = []
+        tree._inorder_traversal(tree.root, inorder)
+        ratings = [record['overall_rating'] for record in inorder]
+        self.assertEqual(ratings, sorted(ratings))
+
+        for i in range(len(inorder)):
+            self.assertIs(tree.select(i), inorder[i])
+        if inorder:
+            self.assertIs(tree.select(-1), inorder[-1])
+        with self.assertRaises(IndexError):
+            tree.select(len(inorder))
+
+        probes = [x / 4 for x in range(-2, 44)]
+        for x in probes:
+            self.assertEqual(tree.rank(x), bisect.bisect_left(ratings, x))
+        for a in probes[::3]:
+            for b in probes[::5]:
+                expected = max(0, bisect.bisect_right(ratings, b) - bisect.bisect_left(ratings, a))
+                self.assertEqual(tree.count_range(a, b), expected, (a, b))
+
+    def test_random_trees_with_duplicates(self):
+        for n, seed in [(0, 0), (1, 1), (2, 2), (3, 3), (50, 4), (500, 5), (2000, 6)]:
+            for kind, tree in self.build_trees(make_records(n, seed)).items():
+                with self.subTest(n=n, kind=kind):
+                    self.assertEqual(tree.get_size(), n)
+                    self.assert_counts(tree)
+                    self.assert_queries(tree)
+
+    def test_counts_after_inserting_into_built_tree(self):
+        records = make_records(300, 7)
+        tree = RedBlackTree()
+        tree.build_from_sorted(records[:200])
+        for rating, data in records[200:]:
+            tree.insert(rating, data)
+        self.assertEqual(tree.get_size(), 300)
+        self.assert_counts(tree)
+        self.assert_queries(tree)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# test_tree_iterators.py
+
+import random
+import sys
+import unittest
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_structures.binary_search_tree import BinarySearchTree
+from data_structures.avl_tree import AVLTree
+from data_structures.red_black_tree import RedBlackTree
+
+TREE_CLASSES = [BinarySearchTree, AVLTree, RedBlackTree]
+
+
+def make_records(n, seed):
+    """Random (rating, record) pairs on a 0.5 grid, so ratings repeat a lot."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        rating = rng.randint(0, 20) / 2
+        records.append((rating, {'id': i, 'overall_rating': rating}))
+    return records
+
+
+def build_trees(tree_class, records):
+    """One tree filled by insert() (no sidecar) and one by build_from_sorted() (sidecar)."""
+    inserted = tree_class()
+    for rating, data in records:
+        inserted.insert(rating, data)
+
+    built = tree_class()
+    built.build_from_sorted(records)
+    return {'insert': inserted, 'build_from_sorted': built}
+
+
+class TestTreeIterators(unittest.TestCase):
+
+    def test_iterators_match_list_methods(self):
+        for tree_class in TREE_CLASSES:
+            for n in (0, 1, 2, 50, 600):
+                for kind, tree in build_trees(tree_class, make_records(n, n)).items():
+                    with self.subTest(tree=tree_class.__name__, n=n, kind=kind):
+                        self.assertEqual(tree._sorted_data is not None, kind == 'build_from_sorted')
+
+                        inorder = []
+                        tree._inorder_traversal(tree.root, inorder)
+                        self.assertEqual(list(tree.iter_inorder()), inorder)
+                        self.assertEqual(list(tree.iter_descending()), inorder[::-1])
+
+                        for a in range(-1, 22, 3):
+                            for b in range(-1, 22, 4):
+                                self.assertEqual(list(tree.iter_range(a / 2, b / 2)),
+                                                 tree.get_range(a / 2, b / 2))
+
+    def test_early_stop(self):
+        for tree_class in TREE_CLASSES:
+            for kind, tree in build_trees(tree_class, make_records(300, 3)).items():
+                with self.subTest(tree=tree_class.__name__, kind=kind):
+                    self.assertEqual(list(islice(tree.iter_inorder(), 7)),
+                                     tree.get_range(float('-inf'), float('inf'))[:7])
+                    self.assertEqual(list(islice(tree.iter_descending(), 7)), tree.get_top_k(7))
+                    self.assertEqual(list(islice(tree.iter_range(3.0, 6.0), 5)),
+                                     tree.get_range(3.0, 6.0)[:5])
+
+if __name__ == '__main__':
+    unittest.main()
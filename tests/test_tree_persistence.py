@@ -0,0 +1,60 @@
+# test_tree_persistence.py
+
+import contextlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_structures.avl_tree import AVLTree
+from utils.tree_persistence import save_trees, load_trees
+
+
+def make_tree(n):
+    tree = AVLTree()
+    for i in range(n):
+        tree.insert(i % 10 / 2, {'id': i, 'overall_rating': i % 10 / 2})
+    return tree
+
+
+def quietly(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+class TestLoadTreesCache(unittest.TestCase):
+
+    def setUp(self):
+        load_trees.cache_clear()
+
+    def test_same_files_share_the_loaded_trees(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            quietly(save_trees, {'AVL': make_tree(20)}, 'sample', tmp)
+            first = quietly(load_trees, 'sample', input_dir=tmp)
+            second = quietly(load_trees, 'sample', input_dir=tmp)
+
+        self.assertIsNot(first, second)
+        self.assertIs(first['AVL'], second['AVL'])
+        self.assertEqual(first['AVL'].get_size(), 20)
+
+    def test_rewritten_file_is_reloaded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            quietly(save_trees, {'AVL': make_tree(20)}, 'sample', tmp)
+            self.assertEqual(quietly(load_trees, 'sample', input_dir=tmp)['AVL'].get_size(), 20)
+
+            # Rewrite the pickle behind the cache's back, as another process would
+            target = Path(tmp) / 'sample_avl_tree.pkl'
+            with open(target, 'wb') as f:
+                pickle.dump(make_tree(35), f, protocol=pickle.HIGHEST_PROTOCOL)
+            stat = target.stat()
+            os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(quietly(load_trees, 'sample', input_dir=tmp)['AVL'].get_size(), 35)
+
+if __name__ == '__main__':
+    unittest.main()